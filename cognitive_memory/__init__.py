@@ -5,46 +5,42 @@ A cognitive memory system for Large Language Models implementing true cognitive
 processing through associative thinking, serendipitous connections, and emergent insights.
 """
 
-from . import core, encoding, retrieval, storage
-from .core import (
-    ActivationResult,
-    BridgeMemory,
-    CognitiveMemory,
-    SearchResult,
-    get_config,
-    log_cognitive_event,
-    setup_logging,
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import core, encoding, git_analysis, retrieval, storage
+    from .core import (
+        ActivationResult,
+        BridgeMemory,
+        CognitiveMemory,
+        SearchResult,
+        get_config,
+        log_cognitive_event,
+        setup_logging,
+    )
+
+# Subpackages and core re-exports are resolved on first attribute access.
+# Importing storage pulls in qdrant_client, which costs about a second, and
+# every CLI invocation imports this package through cognitive_memory.core.
+_SUBMODULES = ("core", "encoding", "retrieval", "storage", "git_analysis")
+_CORE_EXPORTS = (
+    "ActivationResult",
+    "BridgeMemory",
+    "CognitiveMemory",
+    "SearchResult",
+    "get_config",
+    "log_cognitive_event",
+    "setup_logging",
 )
 
-# Git analysis module (when available)
-try:
-    from . import git_analysis
+__all__ = [*_CORE_EXPORTS, *_SUBMODULES]
+
 
-    __all__ = [
-        "ActivationResult",
-        "BridgeMemory",
-        "CognitiveMemory",
-        "SearchResult",
-        "get_config",
-        "log_cognitive_event",
-        "setup_logging",
-        "core",
-        "encoding",
-        "retrieval",
-        "storage",
-        "git_analysis",
-    ]
-except ImportError:
-    __all__ = [
-        "ActivationResult",
-        "BridgeMemory",
-        "CognitiveMemory",
-        "SearchResult",
-        "get_config",
-        "log_cognitive_event",
-        "setup_logging",
-        "core",
-        "encoding",
-        "retrieval",
-        "storage",
-    ]
+def __getattr__(name: str) -> Any:
+    """Import subpackages and core exports lazily."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _CORE_EXPORTS:
+        return getattr(importlib.import_module(".core", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -303,7 +303,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                     results["bridge"].extend(bridge_memories)
 
             # Log retrieval statistics
-            total_retrieved = sum(len(memories) for memories in results.values())
+            total_retrieved = sum(map(len, results.values()))
             logger.info(
                 "Memory retrieval completed",
                 query_length=len(query),
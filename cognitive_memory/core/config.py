@@ -116,47 +116,88 @@ def get_project_paths(project_root: Path | None = None) -> ProjectPaths:
     return ProjectPaths(project_root)
 
 
-def get_monitoring_target_path(project_root: Path | None = None) -> str:
+def _read_monitoring_section(paths: ProjectPaths) -> dict[str, Any]:
     """
-    Get monitoring target path from various sources with centralized priority logic.
-
-    Priority order:
-    1. MONITORING_TARGET_PATH environment variable (highest priority - CLI override)
-    2. .heimdall/config.yaml monitoring.target_path
-    3. Default to ./docs relative to project root
+    Read the monitoring section of .heimdall/config.yaml.
 
     Args:
-        project_root: Root directory of the project. If None, uses current working directory.
+        paths: Project paths locating the config file
 
     Returns:
-        str: Absolute path to monitor
+        dict: The monitoring section, or an empty dict if absent or invalid
     """
-    paths = get_project_paths(project_root)
+    if not paths.config_file.exists():
+        return {}
+
+    try:
+        config_data = yaml.safe_load(paths.config_file.read_text())
+    except Exception as e:
+        logger.warning(f"Failed to parse .heimdall/config.yaml: {e}")
+        return {}
+
+    if config_data and isinstance(config_data, dict):
+        monitoring = config_data.get("monitoring", {})
+        if isinstance(monitoring, dict):
+            return monitoring
+    return {}
+
+
+def _resolve_monitoring_target_path(
+    paths: ProjectPaths, monitoring: dict[str, Any] | None = None
+) -> str:
+    """
+    Resolve the monitoring target path from the environment or config section.
+
+    MONITORING_TARGET_PATH wins over monitoring.target_path from
+    .heimdall/config.yaml; the default is .heimdall/docs under the project
+    root.
 
+    Args:
+        paths: Project paths locating the config file
+        monitoring: Already-read monitoring section; when None, the section is
+            read only if the environment variable is unset
+    """
     # Environment variable takes highest priority (for CLI override)
     env_target = os.getenv("MONITORING_TARGET_PATH")
     if env_target:
         return str(Path(env_target).resolve())
 
-    # Check .heimdall/config.yaml
-    if paths.config_file.exists():
+    if monitoring is None:
+        monitoring = _read_monitoring_section(paths)
+
+    if "target_path" in monitoring:
         try:
-            config_data = yaml.safe_load(paths.config_file.read_text())
-            if config_data and isinstance(config_data, dict):
-                monitoring = config_data.get("monitoring", {})
-                if isinstance(monitoring, dict) and "target_path" in monitoring:
-                    target_path = monitoring["target_path"]
-                    if not os.path.isabs(target_path):
-                        # Resolve relative paths against project root
-                        target_path = str((paths.project_root / target_path).resolve())
-                    return str(target_path)
+            target_path = monitoring["target_path"]
+            if not os.path.isabs(target_path):
+                # Resolve relative paths against project root
+                target_path = str((paths.project_root / target_path).resolve())
+            return str(target_path)
         except Exception as e:
-            logger.warning(f"Failed to parse .heimdall/config.yaml: {e}")
+            logger.warning(f"Invalid monitoring.target_path in config.yaml: {e}")
 
     # Default fallback
     return str((paths.project_root / ".heimdall" / "docs").resolve())
 
 
+def get_monitoring_target_path(project_root: Path | None = None) -> str:
+    """
+    Get monitoring target path from various sources with centralized priority logic.
+
+    Priority order:
+    1. MONITORING_TARGET_PATH environment variable (highest priority - CLI override)
+    2. .heimdall/config.yaml monitoring.target_path
+    3. Default to ./docs relative to project root
+
+    Args:
+        project_root: Root directory of the project. If None, uses current working directory.
+
+    Returns:
+        str: Absolute path to monitor
+    """
+    paths = get_project_paths(project_root)
+    return _resolve_monitoring_target_path(paths)
+
+
 def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
     """
     Get comprehensive monitoring configuration with centralized logic.
@@ -169,9 +210,12 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
     """
     paths = get_project_paths(project_root)
 
+    # .heimdall/config.yaml is read once and shared by every setting below
+    monitoring = _read_monitoring_section(paths)
+
     # Default configuration
     config = {
-        "target_path": get_monitoring_target_path(project_root),
+        "target_path": _resolve_monitoring_target_path(paths, monitoring),
         "interval_seconds": 5.0,
         "ignore_patterns": [".git", "node_modules", "__pycache__", ".pytest_cache"],
     }
@@ -188,34 +232,17 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
     if env_patterns:
         config["ignore_patterns"] = [p.strip() for p in env_patterns.split(",")]
 
-    # Check .heimdall/config.yaml for additional settings
-    if paths.config_file.exists():
+    # Settings from .heimdall/config.yaml, only where the environment is unset
+    if "interval_seconds" in monitoring and not env_interval:
         try:
-            config_data = yaml.safe_load(paths.config_file.read_text())
-            if config_data and isinstance(config_data, dict):
-                monitoring = config_data.get("monitoring", {})
-                if isinstance(monitoring, dict):
-                    # Only override if not already set by environment
-                    if "interval_seconds" in monitoring and not os.getenv(
-                        "MONITORING_INTERVAL_SECONDS"
-                    ):
-                        try:
-                            config["interval_seconds"] = float(
-                                monitoring["interval_seconds"]
-                            )
-                        except (ValueError, TypeError):
-                            logger.warning("Invalid interval_seconds in config.yaml")
-
-                    if "ignore_patterns" in monitoring and not os.getenv(
-                        "MONITORING_IGNORE_PATTERNS"
-                    ):
-                        patterns = monitoring["ignore_patterns"]
-                        if isinstance(patterns, list):
-                            config["ignore_patterns"] = patterns
-        except Exception as e:
-            logger.warning(
-                f"Failed to parse monitoring config from .heimdall/config.yaml: {e}"
-            )
+            config["interval_seconds"] = float(monitoring["interval_seconds"])
+        except (ValueError, TypeError):
+            logger.warning("Invalid interval_seconds in config.yaml")
+
+    if "ignore_patterns" in monitoring and not env_patterns:
+        patterns = monitoring["ignore_patterns"]
+        if isinstance(patterns, list):
+            config["ignore_patterns"] = patterns
 
     return config
 
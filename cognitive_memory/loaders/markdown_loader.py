@@ -5,6 +5,8 @@ This module implements a MemoryLoader for markdown documents, providing
 intelligent chunking, L0/L1/L2 classification, and connection extraction.
 """
 
+import codecs
+import stat
 from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +26,9 @@ from .markdown import (
     MemoryFactory,
 )
 
+# Chunk size used by validate_source when checking that a file is valid UTF-8
+_VALIDATION_CHUNK_BYTES = 64 * 1024
+
 
 class MarkdownMemoryLoader(MemoryLoader):
     """
@@ -126,15 +131,21 @@ class MarkdownMemoryLoader(MemoryLoader):
         """
         try:
             path = Path(source_path)
-            if not path.exists():
-                return False
-            if not path.is_file():
-                return False
             if path.suffix.lower() not in self.get_supported_extensions():
                 return False
-            # Test readability
-            path.read_text(encoding="utf-8")
+            # One stat() covers both the existence and regular-file checks
+            if not stat.S_ISREG(path.stat().st_mode):
+                return False
+            # Decode the whole file in fixed-size chunks so invalid UTF-8
+            # anywhere is caught without building the decoded text in memory
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(_VALIDATION_CHUNK_BYTES), b""):
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
             return True
+        except (FileNotFoundError, NotADirectoryError):
+            return False
         except Exception as e:
             logger.warning(f"Source validation failed for {source_path}: {e}")
             return False
@@ -7,6 +7,8 @@ system factory creation, and health validation.
 """
 
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from loguru import logger
@@ -254,3 +256,35 @@ def graceful_shutdown(system: CognitiveMemorySystem) -> bool:
     except Exception as e:
         logger.error("Failed to perform graceful shutdown", error=str(e))
         return False
+
+
+@contextmanager
+def cognitive_session(
+    config_path: str | None = None, profile: str = "default"
+) -> Iterator[CognitiveMemorySystem]:
+    """
+    Provide an initialized system for the duration of a with block.
+
+    Initializes from config_path when given, otherwise from profile, and
+    always shuts the system down when the block exits, including on errors
+    and early returns.
+
+    Args:
+        config_path: Optional path to configuration file
+        profile: Configuration profile used when no config_path is given
+
+    Yields:
+        CognitiveMemorySystem: The initialized system
+
+    Raises:
+        InitializationError: If system initialization fails
+    """
+    if config_path:
+        system = initialize_with_config(config_path)
+    else:
+        system = initialize_system(profile)
+
+    try:
+        yield system
+    finally:
+        graceful_shutdown(system)
@@ -12,6 +12,8 @@ components for infrastructure operations.
 """
 
 import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import typer
 from loguru import logger
@@ -60,14 +62,8 @@ from heimdall.cli_commands.qdrant_commands import (
     qdrant_stop,
 )
 
-# Set default Loguru log level to WARNING to prevent early DEBUG messages
-# This will be reconfigured by early logging setup based on project config
-logger.remove()
-logger.add(
-    sys.stderr,
-    level="WARNING",
-    format="{time} | {level} | {name}:{function}:{line} - {message}",
-)
+if TYPE_CHECKING:
+    import click
 
 # Initialize rich console for enhanced output
 console = Console()
@@ -157,7 +153,6 @@ def _setup_early_logging() -> None:
     try:
         # Detect project config and apply environment overrides
         import os
-        import sys
 
         from cognitive_memory.core.config import LoggingConfig, detect_project_config
         from cognitive_memory.core.logging_setup import setup_logging
@@ -168,20 +163,14 @@ def _setup_early_logging() -> None:
         # Set default logging level to WARN if not already configured
         # Note: detect_project_config looks for LOG_LEVEL, not HEIMDALL_LOG_LEVEL
         if "LOG_LEVEL" not in os.environ and "HEIMDALL_LOG_LEVEL" not in os.environ:
-            if is_project_init:
-                # During project init, ensure WARNING level to reduce initialization noise
-                os.environ["LOG_LEVEL"] = "WARNING"
-            else:
-                # Try to detect project config first
-                project_config = detect_project_config()
-                if project_config:
-                    # Apply project config to environment variables
-                    for key, value in project_config.items():
-                        if key not in os.environ:  # Only set if not already defined
-                            os.environ[key] = value
-                else:
-                    # No project config found, default to WARNING for all commands
-                    os.environ["LOG_LEVEL"] = "WARNING"
+            # Project init skips config detection to reduce initialization
+            # noise; it and projects without config default to WARNING
+            project_config = None if is_project_init else detect_project_config()
+            env_defaults = project_config or {"LOG_LEVEL": "WARNING"}
+
+            # Apply in one pass; variables that are already defined win
+            for key, value in env_defaults.items():
+                os.environ.setdefault(key, value)
 
         # Create logging config using the environment (including project overrides)
         logging_config = LoggingConfig.from_env()
@@ -200,13 +189,48 @@ def _setup_early_logging() -> None:
         pass
 
 
+def _set_default_log_level() -> None:
+    """
+    Replace Loguru's default DEBUG handler with a WARNING-level one.
+
+    This keeps early DEBUG messages quiet until early logging setup applies
+    the project config. It runs from main() rather than at import time, so
+    importing this module leaves the caller's logging untouched.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="WARNING",
+        format="{time} | {level} | {name}:{function}:{line} - {message}",
+    )
+
+
+@app.callback()
+def _root_callback() -> None:
+    # Click calls this only once it is about to run a subcommand. Bare
+    # invocations and top-level --help are answered before it, so they skip
+    # project config detection, while --help given as an option value (for
+    # example "store x --context --help") still gets logging configured.
+    _setup_early_logging()
+
+
+@lru_cache(maxsize=1)
+def _get_click_command() -> "click.Command":
+    """
+    Build the Click command tree for the app once per process.
+
+    Calling the Typer app directly converts every registered command and
+    group to Click on each call; main() reuses the converted tree instead.
+    """
+    return typer.main.get_command(app)
+
+
 def main() -> int:
     """Main entry point for the unified Heimdall CLI."""
+    _set_default_log_level()
     try:
-        # Set up early logging from project config before any operations
-        _setup_early_logging()
-
-        app()
+        # Early logging from project config is set up by _root_callback
+        _get_click_command()()
         return 0
     except typer.Exit as e:
         return int(e.exit_code) if e.exit_code is not None else 1
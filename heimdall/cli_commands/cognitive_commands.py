@@ -1,60 +1,111 @@
 """Cognitive memory commands: store, recall, load, git-load, status."""
 
 import json
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from cognitive_memory.main import (
-    InitializationError,
-    graceful_shutdown,
-    initialize_system,
-    initialize_with_config,
-)
-from heimdall.display_utils import format_memory_results_json
-from heimdall.operations import CognitiveOperations
+from rich.console import Console, Group, RenderableType
+from rich.text import Text
+
+from heimdall.display_utils import format_memory_results_json, write_json
+
+if TYPE_CHECKING:
+    from cognitive_memory.core.memory import BridgeMemory, CognitiveMemory
 
 console = Console()
 
 
+def _format_recall_entry(i: int, content: str, score: Any) -> str:
+    """Format one numbered recall result, truncating long content."""
+    display_content = content[:200] + "..." if len(content) > 200 else content
+    return f"  {i}. [dim]Score: {score}[/dim]\n     {display_content}"
+
+
+def _format_memory_result(
+    i: int, memory: Any, memory_cls: type["CognitiveMemory"]
+) -> str:
+    """
+    Format a core or peripheral recall result.
+
+    The memory classes are passed in by recall_memories, which imports them
+    once per recall rather than once per printed result.
+    """
+    if isinstance(memory, memory_cls):
+        # Retrieval records the search score in metadata, not as an attribute
+        score = memory.metadata.get("similarity_score", memory.strength)
+        return _format_recall_entry(i, memory.content, round(score, 3))
+    if isinstance(memory, dict):
+        return _format_recall_entry(
+            i,
+            memory.get("content", str(memory)),
+            memory.get("similarity_score", "N/A"),
+        )
+    return _format_recall_entry(i, str(memory), "N/A")
+
+
+def _format_bridge_result(
+    i: int,
+    memory: Any,
+    memory_cls: type["CognitiveMemory"],
+    bridge_cls: type["BridgeMemory"],
+) -> str:
+    """Format a bridge recall result, falling back for non-bridge items."""
+    if isinstance(memory, bridge_cls):
+        return _format_recall_entry(i, memory.memory.content, memory.bridge_score)
+    return _format_memory_result(i, memory, memory_cls)
+
+
+def _require_source_path(source_path: str) -> None:
+    """Exit early for a missing source, before the system is initialized."""
+    if not Path(source_path).exists():
+        console.print(f"❌ Source path does not exist: {source_path}", style="bold red")
+        raise typer.Exit(1)
+
+
 def store_experience(
     text: str = typer.Argument(..., help="Experience text to store"),
     context_json: str | None = typer.Option(
         None, "--context", help="Context as JSON string"
     ),
+    level: int | None = typer.Option(
+        None,
+        "--level",
+        min=0,
+        max=2,
+        help="Hierarchy level (0=concept, 1=context, 2=episode)",
+    ),
     config: str | None = typer.Option(
         None, help="Path to .env configuration file to override default settings"
     ),
 ) -> None:
     """Store an experience in cognitive memory."""
-    try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
 
-        # Create operations instance and store experience
-        ops = CognitiveOperations(cognitive_system)
-        result = ops.store_experience(text, context_json=context_json)
-
-        if result["success"]:
-            console.print(
-                f"✅ Stored: L{result['hierarchy_level']}, {result['memory_type']}",
-                style="bold green",
-            )
-            console.print(f"📝 Memory ID: {result['memory_id']}")
-        else:
-            console.print(
-                f"❌ Failed to store experience: {result['error']}", style="bold red"
+    try:
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and store experience; the level is folded
+            # into the context so the memory is encoded and stored only once
+            ops = CognitiveOperations(cognitive_system)
+            context = {"hierarchy_level": level} if level is not None else None
+            result = ops.store_experience(
+                text, context=context, context_json=context_json
             )
-            raise typer.Exit(1)
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
 
+            if result["success"]:
+                console.print(
+                    f"✅ Stored: L{result['hierarchy_level']}, {result['memory_type']}",
+                    style="bold green",
+                )
+                console.print(f"📝 Memory ID: {result['memory_id']}")
+            else:
+                console.print(
+                    f"❌ Failed to store experience: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -75,72 +126,63 @@ def recall_memories(
     ),
 ) -> None:
     """Retrieve memories matching a query."""
+    from cognitive_memory.core.memory import BridgeMemory, CognitiveMemory
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
+
     try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and retrieve memories
+            ops = CognitiveOperations(cognitive_system)
+            results = ops.retrieve_memories(query, types, limit)
 
-        # Create operations instance and retrieve memories
-        ops = CognitiveOperations(cognitive_system)
-        results = ops.retrieve_memories(query, types, limit)
+            if not results["success"]:
+                console.print(
+                    f"❌ Failed to retrieve memories: {results['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
+
+            if json_output:
+                formatted_json = format_memory_results_json(results)
+                console.print(formatted_json)
+            else:
+                # Display results with terminal-specific formatting, buffered so
+                # the whole result set is rendered and written in one call
+                lines = [
+                    f"🔍 Query: [bold cyan]{query}[/bold cyan]",
+                    f"📊 Total results: {results['total_count']}",
+                ]
+
+                for memory_type in ["core", "peripheral", "bridge"]:
+                    memories = results[memory_type]
+                    if memories:
+                        lines.append(
+                            f"\n[bold]{memory_type.upper()}[/bold] ({len(memories)} results)"
+                        )
 
-        if not results["success"]:
-            console.print(
-                f"❌ Failed to retrieve memories: {results['error']}", style="bold red"
-            )
-            raise typer.Exit(1)
+                        # The result type is fixed per section, so pick its
+                        # formatter once rather than re-checking every item
+                        format_result = (
+                            partial(
+                                _format_bridge_result,
+                                memory_cls=CognitiveMemory,
+                                bridge_cls=BridgeMemory,
+                            )
+                            if memory_type == "bridge"
+                            else partial(
+                                _format_memory_result, memory_cls=CognitiveMemory
+                            )
+                        )
+                        for i, memory in enumerate(memories, 1):
+                            lines.append(format_result(i, memory))
 
-        if json_output:
-            formatted_json = format_memory_results_json(results)
-            console.print(formatted_json)
-        else:
-            # Display results with terminal-specific formatting
-            console.print(f"🔍 Query: [bold cyan]{query}[/bold cyan]")
-            console.print(f"📊 Total results: {results['total_count']}")
+                console.print("\n".join(lines))
 
-            for memory_type in ["core", "peripheral", "bridge"]:
-                memories = results[memory_type]
-                if memories:
+                if results["total_count"] == 0:
                     console.print(
-                        f"\n[bold]{memory_type.upper()}[/bold] ({len(memories)} results)"
+                        "📭 No memories found matching your query", style="bold yellow"
                     )
-
-                    for i, memory in enumerate(memories, 1):
-                        # Handle different memory object types
-                        if hasattr(memory, "memory") and hasattr(
-                            memory.memory, "content"
-                        ):
-                            # This is a BridgeMemory object
-                            content = memory.memory.content
-                            score = getattr(memory, "bridge_score", "N/A")
-                        elif hasattr(memory, "content"):
-                            # This is a CognitiveMemory object
-                            content = memory.content
-                            score = getattr(memory, "similarity_score", "N/A")
-                        elif isinstance(memory, dict):
-                            content = memory.get("content", str(memory))
-                            score = memory.get("similarity_score", "N/A")
-                        else:
-                            content = str(memory)
-                            score = "N/A"
-
-                        # Truncate long content for display
-                        display_content = (
-                            content[:200] + "..." if len(content) > 200 else content
-                        )
-                        console.print(f"  {i}. [dim]Score: {score}[/dim]")
-                        console.print(f"     {display_content}")
-
-            if results["total_count"] == 0:
-                console.print(
-                    "📭 No memories found matching your query", style="bold yellow"
-                )
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
-
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -149,9 +191,48 @@ def recall_memories(
         raise typer.Exit(1) from e
 
 
+def _print_load_result(result: dict[str, Any], dry_run: bool) -> None:
+    """Print the outcome of a successful load operation."""
+    from rich.table import Table
+
+    # Display results with terminal-specific formatting
+    if dry_run:
+        console.print(
+            "🔍 DRY RUN - No memories were actually loaded", style="bold blue"
+        )
+    else:
+        console.print("✅ Memory loading completed successfully", style="bold green")
+
+    # Results table
+    results_table = Table(title="Loading Results")
+    results_table.add_column("Metric", style="cyan")
+    results_table.add_column("Value", style="white")
+
+    results_table.add_row("Memories Loaded", str(result["memories_loaded"]))
+    if result.get("memories_deleted", 0) > 0:
+        results_table.add_row(
+            "Outdated Memories Replaced", str(result["memories_deleted"])
+        )
+    results_table.add_row("Connections Created", str(result["connections_created"]))
+    results_table.add_row("Processing Time", f"{result['processing_time']:.2f}s")
+    results_table.add_row("Memories Failed", str(result["memories_failed"]))
+    results_table.add_row("Connections Failed", str(result["connections_failed"]))
+
+    if result["files_processed"]:
+        results_table.add_row("Files Processed", str(len(result["files_processed"])))
+
+    console.print(results_table)
+
+    # Hierarchy distribution
+    if result["hierarchy_distribution"]:
+        console.print("\n📊 Memory Hierarchy Distribution:")
+        for level, count in result["hierarchy_distribution"].items():
+            console.print(f"  L{level}: {count} memories")
+
+
 def load_memories(
-    source_path: str = typer.Argument(
-        ..., help="Path to the source file or directory to load"
+    source_paths: list[str] = typer.Argument(
+        ..., help="Paths to the source files or directories to load"
     ),
     loader_type: str = typer.Option(
         "markdown", help="Type of loader to use (markdown, git)"
@@ -166,73 +247,53 @@ def load_memories(
         None, help="Path to .env configuration file to override default settings"
     ),
 ) -> None:
-    """Load memories from external source file or directory."""
-    try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
-
-        # Create operations instance and load memories
-        ops = CognitiveOperations(cognitive_system)
-        result = ops.load_memories(
-            source_path=source_path,
-            loader_type=loader_type,
-            dry_run=dry_run,
-            recursive=recursive,
-        )
-
-        if not result["success"]:
-            console.print(
-                f"❌ Failed to load memories: {result['error']}", style="bold red"
-            )
-            raise typer.Exit(1)
-
-        # Display results with terminal-specific formatting
-        if dry_run:
-            console.print(
-                "🔍 DRY RUN - No memories were actually loaded", style="bold blue"
-            )
-        else:
-            console.print(
-                "✅ Memory loading completed successfully", style="bold green"
-            )
-
-        # Results table
-        results_table = Table(title="Loading Results")
-        results_table.add_column("Metric", style="cyan")
-        results_table.add_column("Value", style="white")
-
-        results_table.add_row("Memories Loaded", str(result["memories_loaded"]))
-        if result.get("memories_deleted", 0) > 0:
-            results_table.add_row(
-                "Outdated Memories Replaced", str(result["memories_deleted"])
-            )
-        results_table.add_row("Connections Created", str(result["connections_created"]))
-        results_table.add_row("Processing Time", f"{result['processing_time']:.2f}s")
-        results_table.add_row("Memories Failed", str(result["memories_failed"]))
-        results_table.add_row("Connections Failed", str(result["connections_failed"]))
+    """
+    Load memories from external source files or directories.
 
-        if result["files_processed"]:
-            results_table.add_row(
-                "Files Processed", str(len(result["files_processed"]))
-            )
+    All sources are loaded through one cognitive system, so passing several
+    paths pays for model loading and the Qdrant connection only once.
+    """
+    if loader_type not in ("markdown", "git"):
+        console.print(
+            f"❌ Unsupported loader type: {loader_type}. "
+            "Currently supported: markdown, git",
+            style="bold red",
+        )
+        raise typer.Exit(1)
+    for source_path in source_paths:
+        _require_source_path(source_path)
 
-        console.print(results_table)
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
 
-        # Hierarchy distribution
-        if result["hierarchy_distribution"]:
-            console.print("\n📊 Memory Hierarchy Distribution:")
-            for level, count in result["hierarchy_distribution"].items():
-                console.print(f"  L{level}: {count} memories")
+    try:
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and load memories
+            ops = CognitiveOperations(cognitive_system)
+            for source_path in source_paths:
+                if len(source_paths) > 1:
+                    console.print(f"\n📂 {source_path}", style="bold")
+
+                result = ops.load_memories(
+                    source_path=source_path,
+                    loader_type=loader_type,
+                    dry_run=dry_run,
+                    recursive=recursive,
+                )
 
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+                if not result["success"]:
+                    console.print(
+                        f"❌ Failed to load memories: {result['error']}",
+                        style="bold red",
+                    )
+                    raise typer.Exit(1)
 
+                _print_load_result(result, dry_run)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"❌ Error loading memories: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -252,58 +313,63 @@ def load_git_patterns(
     ),
 ) -> None:
     """Load git commit patterns into cognitive memory."""
-    try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
-
-        # Create operations instance and load git patterns
-        ops = CognitiveOperations(cognitive_system)
-        result = ops.load_git_patterns(
-            repo_path=repo_path,
-            max_commits=max_commits,
-            force_full_load=force_full_load,
-            dry_run=dry_run,
-        )
+    from rich.table import Table
 
-        if not result["success"]:
-            console.print(
-                f"❌ Failed to load git patterns: {result['error']}", style="bold red"
-            )
-            raise typer.Exit(1)
+    _require_source_path(repo_path)
 
-        # Display results with terminal-specific formatting
-        if dry_run:
-            console.print(
-                "🔍 DRY RUN - No patterns were actually loaded", style="bold blue"
-            )
-        else:
-            console.print(
-                "✅ Git pattern loading completed successfully", style="bold green"
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
+
+    try:
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and load git patterns
+            ops = CognitiveOperations(cognitive_system)
+            result = ops.load_git_patterns(
+                repo_path=repo_path,
+                max_commits=max_commits,
+                force_full_load=force_full_load,
+                dry_run=dry_run,
             )
 
-        # Results table
-        results_table = Table(title="Git Loading Results")
-        results_table.add_column("Metric", style="cyan")
-        results_table.add_column("Value", style="white")
+            if not result["success"]:
+                console.print(
+                    f"❌ Failed to load git patterns: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
 
-        results_table.add_row("Patterns Loaded", str(result["memories_loaded"]))
-        if "files_processed" in result:
-            results_table.add_row(
-                "Files Processed", str(len(result["files_processed"]))
-            )
-        results_table.add_row("Connections Created", str(result["connections_created"]))
-        results_table.add_row("Processing Time", f"{result['processing_time']:.2f}s")
-        results_table.add_row("Memories Failed", str(result["memories_failed"]))
-        results_table.add_row("Connections Failed", str(result["connections_failed"]))
+            # Display results with terminal-specific formatting
+            if dry_run:
+                console.print(
+                    "🔍 DRY RUN - No patterns were actually loaded", style="bold blue"
+                )
+            else:
+                console.print(
+                    "✅ Git pattern loading completed successfully", style="bold green"
+                )
 
-        console.print(results_table)
+            # Results table
+            results_table = Table(title="Git Loading Results")
+            results_table.add_column("Metric", style="cyan")
+            results_table.add_column("Value", style="white")
 
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+            results_table.add_row("Patterns Loaded", str(result["memories_loaded"]))
+            if "files_processed" in result:
+                results_table.add_row(
+                    "Files Processed", str(len(result["files_processed"]))
+                )
+            results_table.add_row(
+                "Connections Created", str(result["connections_created"])
+            )
+            results_table.add_row(
+                "Processing Time", f"{result['processing_time']:.2f}s"
+            )
+            results_table.add_row("Memories Failed", str(result["memories_failed"]))
+            results_table.add_row(
+                "Connections Failed", str(result["connections_failed"])
+            )
 
+            console.print(results_table)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -322,69 +388,72 @@ def system_status(
     ),
 ) -> None:
     """Show cognitive memory system status and statistics."""
-    try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
+    from rich.panel import Panel
+    from rich.table import Table
 
-        # Create operations instance and get status
-        ops = CognitiveOperations(cognitive_system)
-        result = ops.get_system_status(detailed=detailed)
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
 
-        if not result["success"]:
-            console.print(
-                f"❌ Failed to get system status: {result['error']}", style="bold red"
-            )
-            raise typer.Exit(1)
-
-        if json_output:
-            console.print(json.dumps(result, indent=2))
-        else:
-            # Terminal-specific formatting
-            console.print("🧠 Cognitive Memory System Status", style="bold blue")
-
-            # Memory counts table
-            if result["memory_counts"]:
-                memory_table = Table(title="Memory Statistics")
-                memory_table.add_column("Type/Level", style="cyan")
-                memory_table.add_column("Count", style="white")
-
-                for key, count in result["memory_counts"].items():
-                    memory_table.add_row(key.replace("_", " ").title(), str(count))
-
-                console.print(memory_table)
-
-            # Detailed information
-            if detailed:
-                if result.get("system_config"):
-                    config_panel = Panel(
-                        json.dumps(result["system_config"], indent=2),
-                        title="System Configuration",
-                        border_style="blue",
-                    )
-                    console.print(config_panel)
+    try:
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and get status
+            ops = CognitiveOperations(cognitive_system)
+            result = ops.get_system_status(detailed=detailed)
 
-                if result.get("storage_stats"):
-                    storage_panel = Panel(
-                        json.dumps(result["storage_stats"], indent=2),
-                        title="Storage Statistics",
-                        border_style="green",
-                    )
-                    console.print(storage_panel)
+            if not result["success"]:
+                console.print(
+                    f"❌ Failed to get system status: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
+
+            if json_output:
+                write_json(result)
+            else:
+                # Terminal-specific formatting, collected into one group so the
+                # status report is rendered and written in a single call
+                renderables: list[RenderableType] = [
+                    Text("🧠 Cognitive Memory System Status", style="bold blue")
+                ]
+
+                # Memory counts table
+                if result["memory_counts"]:
+                    memory_table = Table(title="Memory Statistics")
+                    memory_table.add_column("Type/Level", style="cyan")
+                    memory_table.add_column("Count", style="white")
+
+                    for key, count in result["memory_counts"].items():
+                        memory_table.add_row(key.replace("_", " ").title(), str(count))
+
+                    renderables.append(memory_table)
+
+                # Detailed information
+                if detailed:
+                    if result.get("system_config"):
+                        config_panel = Panel(
+                            json.dumps(result["system_config"], indent=2),
+                            title="System Configuration",
+                            border_style="blue",
+                        )
+                        renderables.append(config_panel)
 
-                if result.get("embedding_info"):
-                    embedding_panel = Panel(
-                        json.dumps(result["embedding_info"], indent=2),
-                        title="Embedding Information",
-                        border_style="yellow",
-                    )
-                    console.print(embedding_panel)
+                    if result.get("storage_stats"):
+                        storage_panel = Panel(
+                            json.dumps(result["storage_stats"], indent=2),
+                            title="Storage Statistics",
+                            border_style="green",
+                        )
+                        renderables.append(storage_panel)
 
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+                    if result.get("embedding_info"):
+                        embedding_panel = Panel(
+                            json.dumps(result["embedding_info"], indent=2),
+                            title="Embedding Information",
+                            border_style="yellow",
+                        )
+                        renderables.append(embedding_panel)
 
+                console.print(Group(*renderables))
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -402,34 +471,30 @@ def remove_file_cmd(
     ),
 ) -> None:
     """Remove all memories associated with a deleted file."""
-    try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
-
-        # Create operations instance and delete memories
-        ops = CognitiveOperations(cognitive_system)
-        result = ops.delete_memories_by_source_path(file_path)
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
 
-        if result["success"]:
-            console.print(
-                f"✅ Removed {result['deleted_count']} memories for: {file_path}",
-                style="bold green",
-            )
-            if result["processing_time"] > 0:
-                console.print(f"⏱️  Processing time: {result['processing_time']:.3f}s")
-        else:
-            console.print(
-                f"❌ Failed to remove memories for {file_path}: {result['error']}",
-                style="bold red",
-            )
-            raise typer.Exit(1)
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+    try:
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance and delete memories
+            ops = CognitiveOperations(cognitive_system)
+            result = ops.delete_memories_by_source_path(file_path)
 
+            if result["success"]:
+                console.print(
+                    f"✅ Removed {result['deleted_count']} memories for: {file_path}",
+                    style="bold green",
+                )
+                if result["processing_time"] > 0:
+                    console.print(
+                        f"⏱️  Processing time: {result['processing_time']:.3f}s"
+                    )
+            else:
+                console.print(
+                    f"❌ Failed to remove memories for {file_path}: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -451,85 +516,80 @@ def delete_memory_cmd(
     ),
 ) -> None:
     """Delete a single memory by its ID."""
+    from rich.table import Table
+
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
+
     try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance
+            ops = CognitiveOperations(cognitive_system)
 
-        # Create operations instance
-        ops = CognitiveOperations(cognitive_system)
+            # First, run dry-run to show what would be deleted
+            preview_result = ops.delete_memory_by_id(memory_id, dry_run=True)
 
-        # First, run dry-run to show what would be deleted
-        preview_result = ops.delete_memory_by_id(memory_id, dry_run=True)
+            if not preview_result["success"]:
+                console.print(f"❌ {preview_result['error']}", style="bold red")
+                raise typer.Exit(1)
 
-        if not preview_result["success"]:
-            console.print(f"❌ {preview_result['error']}", style="bold red")
-            raise typer.Exit(1)
+            if preview_result["deleted_count"] == 0:
+                console.print(
+                    f"📭 No memory found with ID: {memory_id}", style="bold yellow"
+                )
+                return
 
-        if preview_result["deleted_count"] == 0:
-            console.print(
-                f"📭 No memory found with ID: {memory_id}", style="bold yellow"
-            )
-            graceful_shutdown(cognitive_system)
-            return
-
-        # Show preview information
-        preview = preview_result.get("preview", {})
-        console.print(f"🎯 Found memory: [bold cyan]{memory_id}[/bold cyan]")
-
-        # Create preview table
-        preview_table = Table(title="Memory Preview")
-        preview_table.add_column("Property", style="cyan")
-        preview_table.add_column("Value", style="white")
-
-        preview_table.add_row("Content", preview.get("content", "N/A"))
-        preview_table.add_row("Level", f"L{preview.get('hierarchy_level', 'N/A')}")
-        preview_table.add_row("Tags", ", ".join(preview.get("tags", [])) or "None")
-        preview_table.add_row("Source", preview.get("source_path", "N/A"))
-
-        console.print(preview_table)
-
-        if dry_run:
-            console.print("🔍 DRY RUN - Memory would be deleted", style="bold blue")
-            graceful_shutdown(cognitive_system)
-            return
-
-        # Confirmation prompt
-        if not no_confirm:
-            confirm = typer.confirm("Are you sure you want to delete this memory?")
-            if not confirm:
-                console.print("⚠️ Deletion cancelled", style="bold yellow")
-                graceful_shutdown(cognitive_system)
+            # Show preview information
+            preview = preview_result.get("preview", {})
+            console.print(f"🎯 Found memory: [bold cyan]{memory_id}[/bold cyan]")
+
+            # Create preview table
+            preview_table = Table(title="Memory Preview")
+            preview_table.add_column("Property", style="cyan")
+            preview_table.add_column("Value", style="white")
+
+            preview_table.add_row("Content", preview.get("content", "N/A"))
+            preview_table.add_row("Level", f"L{preview.get('hierarchy_level', 'N/A')}")
+            preview_table.add_row("Tags", ", ".join(preview.get("tags", [])) or "None")
+            preview_table.add_row("Source", preview.get("source_path", "N/A"))
+
+            console.print(preview_table)
+
+            if dry_run:
+                console.print("🔍 DRY RUN - Memory would be deleted", style="bold blue")
                 return
 
-        # Perform actual deletion
-        result = ops.delete_memory_by_id(memory_id, dry_run=False)
+            # Confirmation prompt
+            if not no_confirm:
+                confirm = typer.confirm("Are you sure you want to delete this memory?")
+                if not confirm:
+                    console.print("⚠️ Deletion cancelled", style="bold yellow")
+                    return
 
-        if result["success"]:
-            console.print(
-                f"✅ Deleted memory: {memory_id}",
-                style="bold green",
-            )
-            if result["processing_time"] > 0:
-                console.print(f"⏱️  Processing time: {result['processing_time']:.3f}s")
+            # Perform actual deletion
+            result = ops.delete_memory_by_id(memory_id, dry_run=False)
 
-            if result.get("vector_deletion_failures", 0) > 0:
+            if result["success"]:
                 console.print(
-                    "⚠️ Warning: Vector deletion failed but metadata was removed",
-                    style="bold yellow",
+                    f"✅ Deleted memory: {memory_id}",
+                    style="bold green",
                 )
-        else:
-            console.print(
-                f"❌ Failed to delete memory {memory_id}: {result['error']}",
-                style="bold red",
-            )
-            raise typer.Exit(1)
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+                if result["processing_time"] > 0:
+                    console.print(
+                        f"⏱️  Processing time: {result['processing_time']:.3f}s"
+                    )
 
+                if result.get("vector_deletion_failures", 0) > 0:
+                    console.print(
+                        "⚠️ Warning: Vector deletion failed but metadata was removed",
+                        style="bold yellow",
+                    )
+            else:
+                console.print(
+                    f"❌ Failed to delete memory {memory_id}: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -553,101 +613,99 @@ def delete_memories_by_tags_cmd(
     ),
 ) -> None:
     """Delete all memories that have any of the specified tags."""
+    from rich.table import Table
+
+    from cognitive_memory.main import InitializationError, cognitive_session
+    from heimdall.operations import CognitiveOperations
+
     try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
+        with cognitive_session(config) as cognitive_system:
+            # Create operations instance
+            ops = CognitiveOperations(cognitive_system)
 
-        # Create operations instance
-        ops = CognitiveOperations(cognitive_system)
+            # First, run dry-run to show what would be deleted
+            preview_result = ops.delete_memories_by_tags(tags, dry_run=True)
 
-        # First, run dry-run to show what would be deleted
-        preview_result = ops.delete_memories_by_tags(tags, dry_run=True)
+            if not preview_result["success"]:
+                console.print(f"❌ {preview_result['error']}", style="bold red")
+                raise typer.Exit(1)
 
-        if not preview_result["success"]:
-            console.print(f"❌ {preview_result['error']}", style="bold red")
-            raise typer.Exit(1)
+            if preview_result["deleted_count"] == 0:
+                console.print(
+                    f"📭 No memories found with tags: {', '.join(tags)}",
+                    style="bold yellow",
+                )
+                return
 
-        if preview_result["deleted_count"] == 0:
+            # Show preview information
             console.print(
-                f"📭 No memories found with tags: {', '.join(tags)}",
-                style="bold yellow",
+                f"🏷️  Found {preview_result['deleted_count']} memories with tags: [bold cyan]{', '.join(tags)}[/bold cyan]"
             )
-            graceful_shutdown(cognitive_system)
-            return
 
-        # Show preview information
-        console.print(
-            f"🏷️  Found {preview_result['deleted_count']} memories with tags: [bold cyan]{', '.join(tags)}[/bold cyan]"
-        )
+            # Show preview of memories to be deleted
+            preview_memories = preview_result.get("preview", [])
+            if preview_memories:
+                preview_table = Table(title="Memories to Delete")
+                preview_table.add_column("ID", style="dim")
+                preview_table.add_column("Content", style="white")
+                preview_table.add_column("Level", style="cyan")
+                preview_table.add_column("Tags", style="yellow")
+
+                for mem in preview_memories[:10]:  # Show max 10 for readability
+                    preview_table.add_row(
+                        mem["id"][:8] + "...",
+                        mem["content"],
+                        f"L{mem['hierarchy_level']}",
+                        ", ".join(mem["tags"]) or "None",
+                    )
 
-        # Show preview of memories to be deleted
-        preview_memories = preview_result.get("preview", [])
-        if preview_memories:
-            preview_table = Table(title="Memories to Delete")
-            preview_table.add_column("ID", style="dim")
-            preview_table.add_column("Content", style="white")
-            preview_table.add_column("Level", style="cyan")
-            preview_table.add_column("Tags", style="yellow")
-
-            for mem in preview_memories[:10]:  # Show max 10 for readability
-                preview_table.add_row(
-                    mem["id"][:8] + "...",
-                    mem["content"],
-                    f"L{mem['hierarchy_level']}",
-                    ", ".join(mem["tags"]) or "None",
-                )
+                console.print(preview_table)
 
-            console.print(preview_table)
+                if len(preview_memories) > 10:
+                    console.print(
+                        f"... and {len(preview_memories) - 10} more memories",
+                        style="dim",
+                    )
 
-            if len(preview_memories) > 10:
+            if dry_run:
                 console.print(
-                    f"... and {len(preview_memories) - 10} more memories", style="dim"
+                    "🔍 DRY RUN - Memories would be deleted", style="bold blue"
                 )
-
-        if dry_run:
-            console.print("🔍 DRY RUN - Memories would be deleted", style="bold blue")
-            graceful_shutdown(cognitive_system)
-            return
-
-        # Confirmation prompt
-        if not no_confirm:
-            confirm = typer.confirm(
-                f"Are you sure you want to delete {preview_result['deleted_count']} memories?"
-            )
-            if not confirm:
-                console.print("⚠️ Deletion cancelled", style="bold yellow")
-                graceful_shutdown(cognitive_system)
                 return
 
-        # Perform actual deletion
-        result = ops.delete_memories_by_tags(tags, dry_run=False)
+            # Confirmation prompt
+            if not no_confirm:
+                confirm = typer.confirm(
+                    f"Are you sure you want to delete {preview_result['deleted_count']} memories?"
+                )
+                if not confirm:
+                    console.print("⚠️ Deletion cancelled", style="bold yellow")
+                    return
 
-        if result["success"]:
-            console.print(
-                f"✅ Deleted {result['deleted_count']} memories with tags: {', '.join(tags)}",
-                style="bold green",
-            )
-            if result["processing_time"] > 0:
-                console.print(f"⏱️  Processing time: {result['processing_time']:.3f}s")
+            # Perform actual deletion
+            result = ops.delete_memories_by_tags(tags, dry_run=False)
 
-            if result.get("vector_deletion_failures", 0) > 0:
+            if result["success"]:
                 console.print(
-                    f"⚠️ Warning: {result['vector_deletion_failures']} vector deletions failed but metadata was removed",
-                    style="bold yellow",
+                    f"✅ Deleted {result['deleted_count']} memories with tags: {', '.join(tags)}",
+                    style="bold green",
                 )
-        else:
-            console.print(
-                f"❌ Failed to delete memories with tags {', '.join(tags)}: {result['error']}",
-                style="bold red",
-            )
-            raise typer.Exit(1)
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+                if result["processing_time"] > 0:
+                    console.print(
+                        f"⏱️  Processing time: {result['processing_time']:.3f}s"
+                    )
 
+                if result.get("vector_deletion_failures", 0) > 0:
+                    console.print(
+                        f"⚠️ Warning: {result['vector_deletion_failures']} vector deletions failed but metadata was removed",
+                        style="bold yellow",
+                    )
+            else:
+                console.print(
+                    f"❌ Failed to delete memories with tags {', '.join(tags)}: {result['error']}",
+                    style="bold red",
+                )
+                raise typer.Exit(1)
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
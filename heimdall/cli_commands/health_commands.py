@@ -1,25 +1,16 @@
 """Health check and interactive shell commands."""
 
 import json
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-from cognitive_memory.main import (
-    InitializationError,
-    graceful_shutdown,
-    initialize_system,
-    initialize_with_config,
-)
-from heimdall.cognitive_system.health_checker import (
-    HealthChecker,
-    HealthCheckResults,
-    HealthResult,
-)
-from heimdall.interactive_shell import InteractiveShell
+from rich.console import Console, Group, RenderableType
+from rich.text import Text
+
+from heimdall.display_utils import write_json
+
+if TYPE_CHECKING:
+    from heimdall.cognitive_system.health_checker import HealthCheckResults
 
 console = Console()
 
@@ -35,6 +26,10 @@ def health_check(
     config: str | None = typer.Option(None, help="Path to configuration file"),
 ) -> None:
     """Run comprehensive health checks and system verification."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from heimdall.cognitive_system.health_checker import HealthChecker, HealthResult
+
     console.print(
         "🩺 Running cognitive memory system health checks...", style="bold blue"
     )
@@ -45,6 +40,7 @@ def health_check(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=json_output or not console.is_terminal,
     ) as progress:
         task = progress.add_task("Running health checks...", total=None)
 
@@ -71,7 +67,7 @@ def health_check(
                     "recommendations": results.recommendations,
                     "timestamp": results.timestamp.isoformat(),
                 }
-                console.print(json.dumps(json_results, indent=2))
+                write_json(json_results)
 
             else:
                 # Rich formatted output
@@ -93,8 +89,28 @@ def health_check(
             raise typer.Exit(1) from e
 
 
-def _display_health_results(results: HealthCheckResults, verbose: bool) -> None:
+def _format_details(details: dict[str, Any]) -> Text:
+    """
+    Render check details as compact JSON, capped at the console width.
+
+    Details can hold whole version maps or exception text, so they are
+    serialized once, cut to a length the table can show, and wrapped in Text
+    so brackets inside them are not parsed as Rich markup.
+    """
+    details_str = json.dumps(details, default=str, ensure_ascii=False)
+    max_chars = console.width or 120
+    if len(details_str) > max_chars:
+        details_str = details_str[: max_chars - 1] + "…"
+    return Text(details_str)
+
+
+def _display_health_results(results: "HealthCheckResults", verbose: bool) -> None:
     """Display health check results in rich format."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from heimdall.cognitive_system.health_checker import HealthResult
+
     # Overall status panel
     if results.overall_status == HealthResult.HEALTHY:
         status_color = "green"
@@ -111,7 +127,6 @@ def _display_health_results(results: HealthCheckResults, verbose: bool) -> None:
         title="Health Check Summary",
         border_style=status_color,
     )
-    console.print(status_panel)
 
     # Individual checks table
     checks_table = Table(title="Individual Health Checks")
@@ -130,21 +145,26 @@ def _display_health_results(results: HealthCheckResults, verbose: bool) -> None:
         else:
             status_display = "❌ FAIL"
 
-        row_data = [check.name, status_display, check.message]
-        if verbose and check.details:
-            row_data.append(str(check.details))
-        elif verbose:
-            row_data.append("N/A")
+        row_data: list[RenderableType] = [check.name, status_display, check.message]
+        if verbose:
+            row_data.append(_format_details(check.details) if check.details else "N/A")
 
         checks_table.add_row(*row_data)
 
-    console.print(checks_table)
+    # Summary, checks and recommendations are rendered in a single call
+    renderables: list[RenderableType] = [status_panel, checks_table]
 
     # Recommendations
     if results.recommendations:
-        console.print("\n📋 Recommendations:", style="bold blue")
-        for i, recommendation in enumerate(results.recommendations, 1):
-            console.print(f"  {i}. {recommendation}")
+        renderables.append(Text("\n📋 Recommendations:", style="bold blue"))
+        renderables.append(
+            "\n".join(
+                f"  {i}. {recommendation}"
+                for i, recommendation in enumerate(results.recommendations, 1)
+            )
+        )
+
+    console.print(Group(*renderables))
 
 
 def interactive_shell(
@@ -152,6 +172,8 @@ def interactive_shell(
     prompt: str | None = typer.Option(None, help="Custom prompt string"),
 ) -> None:
     """Start interactive cognitive memory shell."""
+    from cognitive_memory.main import InitializationError, cognitive_session
+
     # Show project context
     try:
         from cognitive_memory.core.config import get_project_id
@@ -167,19 +189,13 @@ def interactive_shell(
         )
 
     try:
-        # Initialize cognitive system
-        if config:
-            cognitive_system = initialize_with_config(config)
-        else:
-            cognitive_system = initialize_system("default")
-
-        # Start interactive shell
-        shell = InteractiveShell(cognitive_system, custom_prompt=prompt)
-        shell.run()
-
-        # Cleanup
-        graceful_shutdown(cognitive_system)
+        # prompt_toolkit is only needed once the shell actually starts
+        from heimdall.interactive_shell import InteractiveShell
 
+        with cognitive_session(config) as cognitive_system:
+            # Start interactive shell
+            shell = InteractiveShell(cognitive_system, custom_prompt=prompt)
+            shell.run()
     except InitializationError as e:
         console.print(f"❌ Failed to initialize system: {e}", style="bold red")
         raise typer.Exit(1) from e
@@ -7,10 +7,6 @@ from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
-
-from cognitive_memory.core.config import get_project_id
 
 console = Console()
 
@@ -79,6 +75,8 @@ PLATFORMS = {
 
 def get_server_config() -> ServerConfig:
     """Generate server config with current project paths."""
+    from cognitive_memory.core.config import get_project_id
+
     project_root = Path.cwd()
     project_id = get_project_id(project_root)  # Use the proper project ID function
 
@@ -406,6 +404,8 @@ def install_mcp(
 
 def list_mcp() -> None:
     """List available platforms and installation status."""
+    from rich.table import Table
+
     try:
         console.print("🔗 MCP Platform Overview", style="bold blue")
 
@@ -543,6 +543,8 @@ def remove_mcp(
 
 def status_mcp() -> None:
     """Show installation status for all detected platforms."""
+    from rich.table import Table
+
     try:
         console.print("📊 MCP Installation Status", style="bold blue")
 
@@ -619,6 +621,8 @@ def generate_mcp(
     output: str | None = typer.Option(None, help="Output file path"),
 ) -> None:
     """Generate configuration snippets for manual installation."""
+    from rich.syntax import Syntax
+
     try:
         if platform not in PLATFORMS:
             console.print(f"❌ Unknown platform: {platform}", style="bold red")
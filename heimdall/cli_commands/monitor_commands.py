@@ -1,66 +1,61 @@
 """File monitoring service management commands."""
 
-import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.console import Console, Group
+from rich.text import Text
 
-from heimdall.cognitive_system.monitoring_service import (
-    MonitoringService,
-    MonitoringServiceError,
-)
+from heimdall.display_utils import format_uptime, write_json
+
+if TYPE_CHECKING:
+    from heimdall.cognitive_system.monitoring_service import MonitoringService
 
 console = Console()
 
 
-def monitor_start(
-    project_root: str | None = typer.Option(None, help="Project root directory"),
-) -> None:
-    """Start file monitoring service."""
-    console.print("🔍 Starting file monitoring service...", style="bold blue")
+def _run_monitor_action(
+    project_root: str | None,
+    action: Callable[["MonitoringService"], bool],
+    verb: str,
+    done: str,
+    failure_description: str,
+) -> tuple["MonitoringService", bool]:
+    """
+    Run a monitoring service lifecycle method behind a progress spinner.
+
+    Args:
+        project_root: Project root directory passed to MonitoringService
+        action: Lifecycle call to run on the service, e.g. ``lambda s: s.start()``
+        verb: Progressive form used in messages, e.g. "Starting"
+        done: Past form used in messages, e.g. "started"
+        failure_description: Spinner text shown when the action returns False
+
+    Returns:
+        The service and the boolean returned by the lifecycle method
+
+    Raises:
+        typer.Exit: If the service raises an error
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from heimdall.cognitive_system.monitoring_service import (
+        MonitoringService,
+        MonitoringServiceError,
+    )
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not console.is_terminal,
     ) as progress:
-        task = progress.add_task("Starting monitoring service...", total=None)
+        task = progress.add_task(f"{verb} monitoring service...", total=None)
 
         try:
             service = MonitoringService(project_root=project_root)
-            success = service.start()
-
-            if success:
-                progress.update(task, description="✅ Monitoring service started")
-                console.print(
-                    "✅ File monitoring service started successfully",
-                    style="bold green",
-                )
-                console.print(
-                    "🔄 Running in daemon mode - monitoring files in background",
-                    style="dim",
-                )
-
-                # Show status info
-                status = service.get_status()
-                info_table = Table(title="Service Information")
-                info_table.add_column("Property", style="cyan")
-                info_table.add_column("Value", style="white")
-                info_table.add_row("Status", "✅ Running")
-                info_table.add_row("PID", str(status["pid"]))
-                info_table.add_row("Files Monitored", str(status["files_monitored"]))
-                console.print(info_table)
-
-            else:
-                progress.update(task, description="❌ Failed to start monitoring")
-                console.print(
-                    "❌ Failed to start file monitoring service", style="bold red"
-                )
-                raise typer.Exit(1)
-
+            success = action(service)
         except MonitoringServiceError as e:
             progress.update(task, description=f"❌ Service error: {str(e)}")
             console.print(f"❌ Service error: {e}", style="bold red")
@@ -68,10 +63,57 @@ def monitor_start(
         except Exception as e:
             progress.update(task, description=f"❌ Error: {str(e)}")
             console.print(
-                f"❌ Error starting monitoring service: {e}", style="bold red"
+                f"❌ Error {verb.lower()} monitoring service: {e}", style="bold red"
             )
             raise typer.Exit(1) from e
 
+        if success:
+            progress.update(task, description=f"✅ Monitoring service {done}")
+        else:
+            progress.update(task, description=failure_description)
+
+    return service, success
+
+
+def _print_service_info(service: "MonitoringService", show_restarts: bool) -> None:
+    """Print PID and monitored file count for a running service."""
+    from rich.table import Table
+
+    status = service.get_status()
+    info_table = Table(title="Service Information")
+    info_table.add_column("Property", style="cyan")
+    info_table.add_column("Value", style="white")
+    info_table.add_row("Status", "✅ Running")
+    info_table.add_row("PID", str(status["pid"]))
+    if show_restarts:
+        info_table.add_row("Restart Count", str(status["restart_count"]))
+    info_table.add_row("Files Monitored", str(status["files_monitored"]))
+    console.print(info_table)
+
+
+def monitor_start(
+    project_root: str | None = typer.Option(None, help="Project root directory"),
+) -> None:
+    """Start file monitoring service."""
+    console.print("🔍 Starting file monitoring service...", style="bold blue")
+
+    service, success = _run_monitor_action(
+        project_root,
+        lambda s: s.start(),
+        "Starting",
+        "started",
+        "❌ Failed to start monitoring",
+    )
+    if not success:
+        console.print("❌ Failed to start file monitoring service", style="bold red")
+        raise typer.Exit(1)
+
+    console.print("✅ File monitoring service started successfully", style="bold green")
+    console.print(
+        "🔄 Running in daemon mode - monitoring files in background", style="dim"
+    )
+    _print_service_info(service, show_restarts=False)
+
 
 def monitor_stop(
     project_root: str | None = typer.Option(None, help="Project root directory"),
@@ -79,39 +121,19 @@ def monitor_stop(
     """Stop file monitoring service."""
     console.print("🛑 Stopping file monitoring service...", style="bold yellow")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Stopping monitoring service...", total=None)
-
-        try:
-            service = MonitoringService(project_root=project_root)
-            success = service.stop()
-
-            if success:
-                progress.update(task, description="✅ Monitoring service stopped")
-                console.print(
-                    "✅ File monitoring service stopped successfully",
-                    style="bold green",
-                )
-            else:
-                progress.update(task, description="⚠️ Service was not running")
-                console.print(
-                    "⚠️ File monitoring service was not running", style="bold yellow"
-                )
-
-        except MonitoringServiceError as e:
-            progress.update(task, description=f"❌ Service error: {str(e)}")
-            console.print(f"❌ Service error: {e}", style="bold red")
-            raise typer.Exit(1) from e
-        except Exception as e:
-            progress.update(task, description=f"❌ Error: {str(e)}")
-            console.print(
-                f"❌ Error stopping monitoring service: {e}", style="bold red"
-            )
-            raise typer.Exit(1) from e
+    _, success = _run_monitor_action(
+        project_root,
+        lambda s: s.stop(),
+        "Stopping",
+        "stopped",
+        "⚠️ Service was not running",
+    )
+    if success:
+        console.print(
+            "✅ File monitoring service stopped successfully", style="bold green"
+        )
+    else:
+        console.print("⚠️ File monitoring service was not running", style="bold yellow")
 
 
 def monitor_restart(
@@ -120,52 +142,21 @@ def monitor_restart(
     """Restart file monitoring service."""
     console.print("🔄 Restarting file monitoring service...", style="bold blue")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Restarting monitoring service...", total=None)
+    service, success = _run_monitor_action(
+        project_root,
+        lambda s: s.restart(),
+        "Restarting",
+        "restarted",
+        "❌ Failed to restart monitoring",
+    )
+    if not success:
+        console.print("❌ Failed to restart file monitoring service", style="bold red")
+        raise typer.Exit(1)
 
-        try:
-            service = MonitoringService(project_root=project_root)
-            success = service.restart()
-
-            if success:
-                progress.update(task, description="✅ Monitoring service restarted")
-                console.print(
-                    "✅ File monitoring service restarted successfully",
-                    style="bold green",
-                )
-
-                # Show status info
-                status = service.get_status()
-                info_table = Table(title="Service Information")
-                info_table.add_column("Property", style="cyan")
-                info_table.add_column("Value", style="white")
-                info_table.add_row("Status", "✅ Running")
-                info_table.add_row("PID", str(status["pid"]))
-                info_table.add_row("Restart Count", str(status["restart_count"]))
-                info_table.add_row("Files Monitored", str(status["files_monitored"]))
-                console.print(info_table)
-
-            else:
-                progress.update(task, description="❌ Failed to restart monitoring")
-                console.print(
-                    "❌ Failed to restart file monitoring service", style="bold red"
-                )
-                raise typer.Exit(1)
-
-        except MonitoringServiceError as e:
-            progress.update(task, description=f"❌ Service error: {str(e)}")
-            console.print(f"❌ Service error: {e}", style="bold red")
-            raise typer.Exit(1) from e
-        except Exception as e:
-            progress.update(task, description=f"❌ Error: {str(e)}")
-            console.print(
-                f"❌ Error restarting monitoring service: {e}", style="bold red"
-            )
-            raise typer.Exit(1) from e
+    console.print(
+        "✅ File monitoring service restarted successfully", style="bold green"
+    )
+    _print_service_info(service, show_restarts=True)
 
 
 def monitor_status(
@@ -173,52 +164,64 @@ def monitor_status(
     project_root: str | None = typer.Option(None, help="Project root directory"),
 ) -> None:
     """Show file monitoring service status."""
+    from rich.table import Table
+
+    from heimdall.cognitive_system.monitoring_service import (
+        MonitoringService,
+        MonitoringServiceError,
+    )
+
     try:
         service = MonitoringService(project_root=project_root)
         status = service.get_status()
 
         if json_output:
-            console.print(json.dumps(status, indent=2))
+            write_json(status)
             return
 
         # Rich formatted output
         if status["is_running"]:
-            console.print("🟢 File monitoring service is running", style="bold green")
+            status_line = Text(
+                "🟢 File monitoring service is running", style="bold green"
+            )
         else:
-            console.print("🔴 File monitoring service is stopped", style="bold red")
-
-        # Status table
-        status_table = Table(title="Monitoring Service Status")
-        status_table.add_column("Property", style="cyan")
-        status_table.add_column("Value", style="white")
+            status_line = Text(
+                "🔴 File monitoring service is stopped", style="bold red"
+            )
 
-        status_table.add_row("Status", "Running" if status["is_running"] else "Stopped")
-        status_table.add_row("PID", str(status["pid"]) if status["pid"] else "N/A")
-        status_table.add_row(
-            "Uptime",
-            f"{status['uptime_seconds']:.1f}s" if status["uptime_seconds"] else "N/A",
-        )
-        status_table.add_row("Files Monitored", str(status["files_monitored"]))
-        status_table.add_row("Sync Operations", str(status["sync_operations"]))
-        status_table.add_row("Error Count", str(status["error_count"]))
-        status_table.add_row("Restart Count", str(status["restart_count"]))
+        # Status table, built from rows computed up front
+        rows = [
+            ("Status", "Running" if status["is_running"] else "Stopped"),
+            ("PID", str(status["pid"]) if status["pid"] else "N/A"),
+            ("Uptime", format_uptime(status["uptime_seconds"])),
+            ("Files Monitored", str(status["files_monitored"])),
+            ("Sync Operations", str(status["sync_operations"])),
+            ("Error Count", str(status["error_count"])),
+            ("Restart Count", str(status["restart_count"])),
+        ]
 
         if status["memory_usage_mb"]:
-            status_table.add_row("Memory Usage", f"{status['memory_usage_mb']:.1f} MB")
+            rows.append(("Memory Usage", f"{status['memory_usage_mb']:.1f} MB"))
 
         if status["cpu_percent"]:
-            status_table.add_row("CPU Usage", f"{status['cpu_percent']:.1f}%")
+            rows.append(("CPU Usage", f"{status['cpu_percent']:.1f}%"))
 
         if status["last_sync_time"]:
             import datetime
 
             sync_time = datetime.datetime.fromtimestamp(status["last_sync_time"])
-            status_table.add_row("Last Sync", sync_time.strftime("%Y-%m-%d %H:%M:%S"))
+            rows.append(("Last Sync", sync_time.strftime("%Y-%m-%d %H:%M:%S")))
 
         if status["last_error"]:
-            status_table.add_row("Last Error", status["last_error"])
+            rows.append(("Last Error", status["last_error"]))
 
-        console.print(status_table)
+        status_table = Table(title="Monitoring Service Status")
+        status_table.add_column("Property", style="cyan")
+        status_table.add_column("Value", style="white")
+        for row in rows:
+            status_table.add_row(*row)
+
+        console.print(Group(status_line, status_table))
 
     except MonitoringServiceError as e:
         console.print(f"❌ Service error: {e}", style="bold red")
@@ -233,12 +236,20 @@ def monitor_health(
     project_root: str | None = typer.Option(None, help="Project root directory"),
 ) -> None:
     """Perform file monitoring service health check."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from heimdall.cognitive_system.monitoring_service import (
+        MonitoringService,
+        MonitoringServiceError,
+    )
+
     try:
         service = MonitoringService(project_root=project_root)
         health = service.health_check()
 
         if json_output:
-            console.print(json.dumps(health, indent=2))
+            write_json(health)
             return
 
         # Rich formatted output
@@ -1,16 +1,165 @@
 """Project memory management commands."""
 
+import functools
+import importlib.util
 import json
+import os
+import re
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+
+from heimdall.display_utils import write_json
 
 console = Console()
 
+# Project collections are named {project_id}_{level}
+_MEMORY_LEVELS = ("concepts", "contexts", "episodes")
+_LEVEL_SUFFIXES = tuple(f"_{level}" for level in _MEMORY_LEVELS)
+_COLLECTION_NAME_RE = re.compile(rf"^(.+)_({'|'.join(_MEMORY_LEVELS)})$")
+
+# Default .heimdall/config.yaml written by project init when no template exists
+_DEFAULT_PROJECT_CONFIG = """\
+database:
+  path: ./.heimdall/cognitive_memory.db
+logging:
+  level: warn
+monitoring:
+  enabled: true
+  ignore_patterns:
+  - .git
+  - node_modules
+  - __pycache__
+  - .pytest_cache
+  interval_seconds: 5.0
+  target_path: ./.heimdall/docs
+project_id: {project_id}
+qdrant_url: {qdrant_url}
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _qdrant_endpoint(url: str) -> tuple[str, int]:
+    """Derive the (host, port) pair for a Qdrant URL."""
+    parsed_url = urlparse(url)
+    return parsed_url.hostname or "localhost", parsed_url.port or 6333
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(host: str, port: int, prefer_grpc: bool) -> Any:
+    """
+    Return a shared QdrantClient for host:port.
+
+    Cached so that repeated commands in one process reuse the same connection
+    pool (or gRPC channel) instead of re-establishing it, and so that
+    qdrant_client is only imported on first use.
+    """
+    from qdrant_client import QdrantClient
+
+    return QdrantClient(host=host, port=port, prefer_grpc=prefer_grpc)
+
+
+def _is_qdrant_reachable(host: str, port: int, timeout: float = 0.25) -> bool:
+    """
+    Probe Qdrant with a single TCP connect.
+
+    Used as a gate before talking to Qdrant; much cheaper than a full
+    QdrantManager status query (Docker lookup, process scan, HTTP health).
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+# Short-lived cache of collection listings, keyed by (host, port, prefer_grpc)
+_COLLECTION_LISTING_TTL_SECONDS = 5.0
+_collection_listing_cache: dict[
+    tuple[str, int, bool], tuple[float, tuple[str, ...]]
+] = {}
+
+
+def _list_collection_names(host: str, port: int, prefer_grpc: bool) -> tuple[str, ...]:
+    """
+    List collection names in the Qdrant instance at host:port.
+
+    Results are cached for a few seconds so that flows which need the listing
+    more than once (e.g. list followed by clean) only pay for one round-trip.
+    Call ``_invalidate_collection_names()`` after creating or deleting
+    collections.
+    """
+    key = (host, port, prefer_grpc)
+    cached = _collection_listing_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _COLLECTION_LISTING_TTL_SECONDS:
+        return cached[1]
+
+    client = _get_client(host, port, prefer_grpc)
+    names = tuple(c.name for c in client.get_collections().collections)
+    _collection_listing_cache[key] = (now, names)
+    return names
+
+
+def _invalidate_collection_names() -> None:
+    """Drop cached collection listings."""
+    _collection_listing_cache.clear()
+
+
+def _gather_collection_stats(
+    client: Any, names: list[str]
+) -> dict[str, tuple[int, int]]:
+    """
+    Fetch point and indexed vector counts for several collections concurrently.
+
+    Args:
+        client: Qdrant client to query
+        names: Collection names to fetch info for
+
+    Returns:
+        Mapping of collection name to (points_count, indexed_vectors_count).
+        Collections that cannot be queried map to (0, 0).
+    """
+    stats: dict[str, tuple[int, int]] = {}
+    if not names:
+        return stats
+
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+        futures = {executor.submit(client.get_collection, name): name for name in names}
+        for future in as_completed(futures):
+            try:
+                collection_info = future.result()
+                stats[futures[future]] = (
+                    collection_info.points_count or 0,
+                    collection_info.indexed_vectors_count or 0,
+                )
+            except Exception:
+                stats[futures[future]] = (0, 0)
+
+    return stats
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """
+    Write text to path atomically.
+
+    Content goes to a temporary sibling file that is then renamed over the
+    target, so an interrupted write never leaves a truncated file behind.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 def _is_git_repository(project_path: Path) -> bool:
     """Check if the project path is within a git repository."""
@@ -105,6 +254,9 @@ def project_init(
     ),
 ) -> None:
     """Initialize project-specific collections and setup."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
     try:
         # Validate flag combinations early
         if auto_monitor and no_monitor:
@@ -154,24 +306,28 @@ def project_init(
         console.print(f"🚀 Initializing project: {project_id}", style="bold blue")
         console.print(f"📁 Project root: {project_path}")
 
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
+        # Create Qdrant client configuration
+        qdrant_config = QdrantConfig.from_env()
+        host, port = _qdrant_endpoint(qdrant_config.url)
 
-        if status.status.value != "running":
-            if auto_start_qdrant:
-                console.print(
-                    "🔄 Qdrant not running, starting automatically...",
-                    style="bold yellow",
-                )
+        # Run all setup phases under a single progress display
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=not console.is_terminal,
+        ) as progress:
+            # Check Qdrant status
+            if not _is_qdrant_reachable(host, port):
+                if auto_start_qdrant:
+                    console.print(
+                        "🔄 Qdrant not running, starting automatically...",
+                        style="bold yellow",
+                    )
 
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
                     task = progress.add_task("Starting Qdrant service...", total=None)
 
+                    manager = QdrantManager()
                     success = manager.start(wait_timeout=30)
                     if not success:
                         progress.update(task, description="❌ Failed to start Qdrant")
@@ -181,29 +337,16 @@ def project_init(
                         raise typer.Exit(1)
 
                     progress.update(task, description="✅ Qdrant started successfully")
-            else:
-                console.print(
-                    "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
-                    style="bold red",
-                )
-                raise typer.Exit(1)
-
-        # Load system configuration to get embedding dimension
-        config = SystemConfig.from_env()
-
-        # Create Qdrant client configuration
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
+                else:
+                    console.print(
+                        "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
+                        style="bold red",
+                    )
+                    raise typer.Exit(1)
 
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
+            # Load system configuration to get embedding dimension
+            config = SystemConfig.from_env()
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
             task = progress.add_task("Initializing project collections...", total=None)
 
             # Create hierarchical storage to initialize collections
@@ -217,13 +360,8 @@ def project_init(
 
             progress.update(task, description="✅ Project collections initialized")
 
-        # Initialize shared environment and download models if needed
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Initialize shared data directories first
+            # Initialize shared environment and download models if needed,
+            # starting with the shared data directories
             task = progress.add_task(
                 "Setting up shared data directories...", total=None
             )
@@ -262,28 +400,35 @@ def project_init(
             # Check and download spaCy model
             task = progress.add_task("Checking spaCy model...", total=None)
 
-            try:
-                import spacy
-
-                # Try to load the model
-                spacy.load("en_core_web_md")
+            # Look the model package up without materializing its pipeline
+            if importlib.util.find_spec("en_core_web_md") is not None:
                 progress.update(task, description="✅ spaCy model already available")
-            except OSError:
+            else:
                 # Model not found, download it
                 progress.update(
                     task, description="📥 Downloading spaCy model (en_core_web_md)..."
                 )
 
-                import subprocess
-                import sys
+                import contextlib
+                import io
 
-                result = subprocess.run(
-                    [sys.executable, "-m", "spacy", "download", "en_core_web_md"],
-                    capture_output=True,
-                    text=True,
-                )
+                from spacy.cli.download import download as spacy_download
 
-                if result.returncode == 0:
+                # Download in-process rather than spawning a child interpreter
+                # that has to import spaCy from scratch
+                output = io.StringIO()
+                download_error: str | None = None
+                try:
+                    with (
+                        contextlib.redirect_stdout(output),
+                        contextlib.redirect_stderr(output),
+                    ):
+                        spacy_download("en_core_web_md")
+                except (Exception, SystemExit) as e:
+                    # spacy.cli.download exits via SystemExit on failure
+                    download_error = output.getvalue().strip() or str(e)
+
+                if download_error is None:
                     progress.update(
                         task, description="✅ spaCy model downloaded successfully"
                     )
@@ -292,7 +437,7 @@ def project_init(
                         task, description="❌ Failed to download spaCy model"
                     )
                     console.print(
-                        f"❌ Failed to download spaCy model. Error: {result.stderr}",
+                        f"❌ Failed to download spaCy model. Error: {download_error}",
                         style="bold red",
                     )
                     console.print(
@@ -302,7 +447,7 @@ def project_init(
 
         # Create project configuration file and directories
         heimdall_dir = project_path / ".heimdall"
-        heimdall_dir.mkdir(exist_ok=True)
+        heimdall_dir.mkdir(parents=True, exist_ok=True)
 
         # Add .heimdall to .gitignore (only if this is a git repository)
         _ensure_heimdall_in_gitignore(project_path)
@@ -313,8 +458,6 @@ def project_init(
 
         config_file = heimdall_dir / "config.yaml"
         if not config_file.exists():
-            import yaml
-
             # Use template-based generation
             template_path = (
                 Path(__file__).parent.parent.parent
@@ -325,31 +468,14 @@ def project_init(
                 template = template_path.read_text()
                 yaml_content = template.replace("${project_id}", project_id)
                 yaml_content = yaml_content.replace("${qdrant_url}", qdrant_config.url)
-                config_file.write_text(yaml_content)
             else:
-                # Fallback to direct YAML generation
-                project_config = {
-                    "project_id": project_id,
-                    "qdrant_url": qdrant_config.url,
-                    "logging": {
-                        "level": "warn",
-                    },
-                    "monitoring": {
-                        "enabled": True,
-                        "target_path": "./.heimdall/docs",
-                        "interval_seconds": 5.0,
-                        "ignore_patterns": [
-                            ".git",
-                            "node_modules",
-                            "__pycache__",
-                            ".pytest_cache",
-                        ],
-                    },
-                    "database": {"path": "./.heimdall/cognitive_memory.db"},
-                }
-                config_file.write_text(
-                    yaml.dump(project_config, default_flow_style=False)
+                # Fallback to the built-in default configuration. Values are
+                # JSON-quoted, which YAML reads as plain double-quoted strings.
+                yaml_content = _DEFAULT_PROJECT_CONFIG.format(
+                    project_id=json.dumps(project_id),
+                    qdrant_url=json.dumps(qdrant_config.url),
                 )
+            _write_text_atomic(config_file, yaml_content)
 
             console.print(f"📝 Created configuration: {config_file}")
             console.print(f"📁 Created monitoring directory: {docs_dir}")
@@ -429,7 +555,7 @@ Files in this directory are automatically:
                 "git_hooks_installed": git_hooks_installed,
                 "mcp_configured_platforms": mcp_configured_platforms,
             }
-            console.print(json.dumps(output_data, indent=2))
+            write_json(output_data)
         else:
             # Execute user-selected features
             git_history_loaded = False
@@ -464,7 +590,7 @@ Files in this directory are automatically:
             info_table.add_row("Config File", str(config_file))
             info_table.add_row(
                 "Collections",
-                f"{project_id}_concepts, {project_id}_contexts, {project_id}_episodes",
+                ", ".join(f"{project_id}{suffix}" for suffix in _LEVEL_SUFFIXES),
             )
 
             # Add MCP platforms if any were configured
@@ -485,17 +611,16 @@ def project_list(
     ),
 ) -> None:
     """List all projects in shared Qdrant instance."""
-    try:
-        from qdrant_client import QdrantClient
+    from rich.table import Table
 
+    try:
         from cognitive_memory.core.config import QdrantConfig
-        from heimdall.cognitive_system.service_manager import QdrantManager
 
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
+        qdrant_config = QdrantConfig.from_env()
+        host, port = _qdrant_endpoint(qdrant_config.url)
 
-        if status.status.value != "running":
+        # Check Qdrant status
+        if not _is_qdrant_reachable(host, port):
             console.print(
                 "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
                 style="bold red",
@@ -503,55 +628,35 @@ def project_list(
             raise typer.Exit(1)
 
         # Create Qdrant client
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
-
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
-
-        client = QdrantClient(
-            host=host, port=port, prefer_grpc=qdrant_config.prefer_grpc
-        )
+        client = _get_client(host, port, qdrant_config.prefer_grpc)
 
         # Get all collections and extract project IDs
         try:
-            all_collections = client.get_collections().collections
+            all_collections = _list_collection_names(
+                host, port, qdrant_config.prefer_grpc
+            )
             projects: dict[str, list[dict[str, Any]]] = {}
+            matched: list[tuple[str, str, str]] = []
 
-            for collection in all_collections:
+            for collection_name in all_collections:
                 # Extract project ID from collection name (format: {project_id}_{level})
-                if "_" in collection.name:
-                    parts = collection.name.rsplit("_", 1)
-                    if len(parts) == 2 and parts[1] in [
-                        "concepts",
-                        "contexts",
-                        "episodes",
-                    ]:
-                        project_id = parts[0]
-                        if project_id not in projects:
-                            projects[project_id] = []
-
-                        # Get detailed collection info for stats
-                        try:
-                            collection_info = client.get_collection(collection.name)
-                            points_count = collection_info.points_count
-                            indexed_vectors_count = (
-                                collection_info.indexed_vectors_count
-                            )
-                        except Exception:
-                            points_count = 0
-                            indexed_vectors_count = 0
-
-                        projects[project_id].append(
-                            {
-                                "name": collection.name,
-                                "level": parts[1],
-                                "vectors_count": points_count,  # Use points_count as vectors_count
-                                "points_count": points_count,
-                                "indexed_vectors_count": indexed_vectors_count,
-                            }
-                        )
+                match = _COLLECTION_NAME_RE.match(collection_name)
+                if match:
+                    matched.append((collection_name, match.group(1), match.group(2)))
+
+            # Fetch detailed collection info for stats concurrently
+            stats = _gather_collection_stats(client, [name for name, _, _ in matched])
+
+            for name, project_id, level in matched:
+                points_count, indexed_vectors_count = stats.get(name, (0, 0))
+                projects.setdefault(project_id, []).append(
+                    {
+                        "name": name,
+                        "level": level,
+                        "points_count": points_count,
+                        "indexed_vectors_count": indexed_vectors_count,
+                    }
+                )
 
             if json_output:
                 result = {
@@ -559,7 +664,7 @@ def project_list(
                     "projects": projects,
                     "qdrant_url": qdrant_config.url,
                 }
-                console.print(json.dumps(result, indent=2))
+                write_json(result)
             else:
                 if not projects:
                     console.print(
@@ -582,13 +687,16 @@ def project_list(
                     for project_id, collections in projects.items():
                         collection_names = ", ".join([c["name"] for c in collections])
                         if show_collections:
-                            total_vectors = sum(c["vectors_count"] for c in collections)
-                            total_points = sum(c["points_count"] for c in collections)
+                            # Every point holds one vector, so both columns
+                            # show the same total
+                            total_points = str(
+                                sum(c["points_count"] for c in collections)
+                            )
                             projects_table.add_row(
                                 project_id,
                                 collection_names,
-                                str(total_vectors),
-                                str(total_points),
+                                total_points,
+                                total_points,
                             )
                         else:
                             projects_table.add_row(project_id, collection_names)
@@ -615,13 +723,13 @@ def project_clean(
     project_root: str | None = typer.Option(
         None, help="Project root directory (defaults to current directory)"
     ),
+    verbose: bool = typer.Option(
+        False, "--verbose", help="Include exact vector counts in --dry-run output"
+    ),
 ) -> None:
     """Remove project collections and setup from current directory."""
     try:
-        from qdrant_client import QdrantClient
-
         from cognitive_memory.core.config import QdrantConfig, get_project_id
-        from heimdall.cognitive_system.service_manager import QdrantManager
 
         # Determine project root and generate project ID
         if project_root:
@@ -634,11 +742,11 @@ def project_clean(
         console.print(f"🗑️ Cleaning project: {project_id}")
         console.print(f"📁 Project root: {project_path}")
 
-        # Check Qdrant status
-        manager = QdrantManager()
-        status = manager.get_status()
+        qdrant_config = QdrantConfig.from_env()
+        host, port = _qdrant_endpoint(qdrant_config.url)
 
-        if status.status.value != "running":
+        # Check Qdrant status
+        if not _is_qdrant_reachable(host, port):
             console.print(
                 "❌ Qdrant is not running. Please start it with: heimdall qdrant start",
                 style="bold red",
@@ -646,28 +754,22 @@ def project_clean(
             raise typer.Exit(1)
 
         # Create Qdrant client
-        qdrant_config = QdrantConfig.from_env()
-        from urllib.parse import urlparse
-
-        parsed_url = urlparse(qdrant_config.url)
-        host = parsed_url.hostname or "localhost"
-        port = parsed_url.port or 6333
-
-        client = QdrantClient(
-            host=host, port=port, prefer_grpc=qdrant_config.prefer_grpc
-        )
+        client = _get_client(host, port, qdrant_config.prefer_grpc)
 
         # Find collections for this project
         try:
-            all_collections = client.get_collections().collections
-            project_collections = [
-                c
-                for c in all_collections
-                if c.name.startswith(f"{project_id}_")
-                and c.name.endswith(("_concepts", "_contexts", "_episodes"))
+            all_collections = _list_collection_names(
+                host, port, qdrant_config.prefer_grpc
+            )
+            # Cheap prefix check first discards other projects' collections
+            prefix = f"{project_id}_"
+            collection_names = [
+                name
+                for name in all_collections
+                if name.startswith(prefix) and name.endswith(_LEVEL_SUFFIXES)
             ]
 
-            if not project_collections:
+            if not collection_names:
                 console.print(
                     f"⚠️ No collections found for project: {project_id}",
                     style="bold yellow",
@@ -675,17 +777,6 @@ def project_clean(
                 console.print("Use 'heimdall project list' to see available projects")
                 raise typer.Exit(1)
 
-            collection_names = [c.name for c in project_collections]
-
-            # Get detailed collection info to calculate total vectors
-            total_vectors = 0
-            for collection in project_collections:
-                try:
-                    collection_info = client.get_collection(collection.name)
-                    total_vectors += collection_info.points_count
-                except Exception:
-                    pass  # Skip collections that can't be queried
-
             if dry_run:
                 console.print(
                     f"🔍 DRY RUN: Would delete {len(collection_names)} collection(s) for project '{project_id}':",
@@ -693,9 +784,24 @@ def project_clean(
                 )
                 for name in collection_names:
                     console.print(f"  - {name}")
-                console.print(f"Total vectors that would be deleted: {total_vectors}")
+                # Exact counts cost one request per collection, so only on demand
+                if verbose:
+                    stats = _gather_collection_stats(client, collection_names)
+                    total_vectors = sum(points for points, _ in stats.values())
+                    console.print(
+                        f"Total vectors that would be deleted: {total_vectors}"
+                    )
+                else:
+                    console.print(
+                        "Total vectors that would be deleted: "
+                        "(use --verbose for exact count)"
+                    )
                 return
 
+            # Get detailed collection info to calculate total vectors
+            stats = _gather_collection_stats(client, collection_names)
+            total_vectors = sum(points for points, _ in stats.values())
+
             # Show what will be deleted
             console.print(
                 f"🗑️ Will delete {len(collection_names)} collection(s) for project '{project_id}':",
@@ -715,19 +821,30 @@ def project_clean(
                     raise typer.Exit(0)
 
             # Delete collections
-            deleted_collections = []
-            failed_collections = []
-
-            for collection in project_collections:
+            def _delete(name: str) -> str | None:
+                """Delete one collection, returning the error message on failure."""
                 try:
-                    client.delete_collection(collection.name)
-                    deleted_collections.append(collection.name)
-                    console.print(f"✅ Deleted: {collection.name}")
+                    client.delete_collection(name)
+                    return None
                 except Exception as e:
-                    failed_collections.append(
-                        {"name": collection.name, "error": str(e)}
-                    )
-                    console.print(f"❌ Failed to delete {collection.name}: {e}")
+                    return str(e)
+
+            # Deletes are independent round-trips, so issue them concurrently;
+            # executor.map yields results in input order, which keeps the
+            # console and --json output stable
+            with ThreadPoolExecutor(max_workers=len(collection_names)) as executor:
+                errors = list(executor.map(_delete, collection_names))
+            _invalidate_collection_names()
+
+            deleted_collections: list[str] = []
+            failed_collections: list[dict[str, str]] = []
+            for name, error in zip(collection_names, errors, strict=True):
+                if error is None:
+                    deleted_collections.append(name)
+                    console.print(f"✅ Deleted: {name}")
+                else:
+                    failed_collections.append({"name": name, "error": error})
+                    console.print(f"❌ Failed to delete {name}: {error}")
 
             # Check for .heimdall directory and git hooks after successful collection deletion
             heimdall_dir_removed = False
@@ -808,7 +925,7 @@ def project_clean(
                     "git_hooks_removed": git_hooks_removed,
                     "git_hooks_error": git_hooks_error,
                 }
-                console.print(json.dumps(result, indent=2))
+                write_json(result)
             else:
                 if deleted_collections:
                     console.print(
@@ -972,6 +1089,8 @@ def _execute_git_history_loading(project_path: Path) -> bool:
     Returns:
         True if git history loading succeeded
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         console.print("📚 Loading git history into memory...", style="bold blue")
 
@@ -979,23 +1098,24 @@ def _execute_git_history_loading(project_path: Path) -> bool:
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
             task = progress.add_task("Processing git commits...", total=None)
 
             # Import and use the operations layer
-            from cognitive_memory.main import initialize_system
+            from cognitive_memory.main import cognitive_session
             from heimdall.operations import CognitiveOperations
 
             # Initialize cognitive system and operations
-            cognitive_system = initialize_system()
-            operations = CognitiveOperations(cognitive_system)
-
-            # Load git patterns (full history)
-            result = operations.load_git_patterns(
-                repo_path=str(project_path),
-                dry_run=False,
-                max_commits=None,  # Load full history
-            )
+            with cognitive_session() as cognitive_system:
+                operations = CognitiveOperations(cognitive_system)
+
+                # Load git patterns (full history)
+                result = operations.load_git_patterns(
+                    repo_path=str(project_path),
+                    dry_run=False,
+                    max_commits=None,  # Load full history
+                )
 
             success = result.get("success", False)
             memories_loaded = result.get("memories_loaded", 0)
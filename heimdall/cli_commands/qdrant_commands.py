@@ -1,16 +1,55 @@
 """Qdrant vector database management commands."""
 
-import json
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.console import Console, Group, RenderableType
+from rich.style import Style
+from rich.text import Text
 
-from heimdall.cognitive_system.service_manager import QdrantManager, ServiceStatus
+from heimdall.display_utils import format_uptime, write_json
+
+if TYPE_CHECKING:
+    from heimdall.cognitive_system.service_manager import QdrantManager
 
 console = Console()
 
+# Styles and fixed messages are built once so printing them skips Rich's
+# style-string and markup parsing
+_STYLE_INFO = Style(color="blue", bold=True)
+_STYLE_SUCCESS = Style(color="green", bold=True)
+_STYLE_WARNING = Style(color="yellow", bold=True)
+_STYLE_ERROR = Style(color="red", bold=True)
+
+_MSG_STARTING = Text("🚀 Starting Qdrant vector database...", style=_STYLE_INFO)
+_MSG_START_FAILED = Text("❌ Failed to start Qdrant service", style=_STYLE_ERROR)
+_MSG_STOPPING = Text("🛑 Stopping Qdrant vector database...", style=_STYLE_WARNING)
+_MSG_STOPPED = Text("✅ Qdrant service stopped", style=_STYLE_SUCCESS)
+_MSG_NOT_RUNNING = Text("⚠️ Qdrant service was not running", style=_STYLE_WARNING)
+_MSG_STATUS_RUNNING = Text("🟢 Qdrant is running", style=_STYLE_SUCCESS)
+_MSG_STATUS_STOPPED = Text("🔴 Qdrant is stopped", style=_STYLE_ERROR)
+_MSG_STATUS_UNKNOWN = Text("🟡 Qdrant status unknown", style=_STYLE_WARNING)
+_MSG_FOLLOWING_LOGS = Text(
+    "📄 Following Qdrant logs (Ctrl+C to stop)...", style=_STYLE_INFO
+)
+_MSG_STOPPED_FOLLOWING = Text("\n⏹️ Stopped following logs", style=_STYLE_WARNING)
+_LOG_SEPARATOR = Text("-" * 60)
+
+
+@lru_cache(maxsize=1)
+def _qdrant_manager() -> "QdrantManager":
+    """
+    Return the process-wide Qdrant service manager.
+
+    Construction connects to Docker and pings it, so the manager is built
+    once and shared by every qdrant command run in this process.
+    """
+    from heimdall.cognitive_system.service_manager import QdrantManager
+
+    return QdrantManager()
+
 
 def qdrant_start(
     port: int = typer.Option(6333, help="Port for Qdrant service"),
@@ -22,14 +61,18 @@ def qdrant_start(
     wait_timeout: int = typer.Option(30, help="Seconds to wait for startup"),
 ) -> None:
     """Start Qdrant vector database service."""
-    console.print("🚀 Starting Qdrant vector database...", style="bold blue")
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    console.print(_MSG_STARTING)
 
-    manager = QdrantManager()
+    manager = _qdrant_manager()
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Starting Qdrant service...", total=None)
 
@@ -45,7 +88,7 @@ def qdrant_start(
             if success:
                 progress.update(task, description="✅ Qdrant started successfully")
                 console.print(
-                    f"🎉 Qdrant is running on port {port}", style="bold green"
+                    f"🎉 Qdrant is running on port {port}", style=_STYLE_SUCCESS
                 )
 
                 # Show connection info
@@ -62,25 +105,30 @@ def qdrant_start(
 
             else:
                 progress.update(task, description="❌ Failed to start Qdrant")
-                console.print("❌ Failed to start Qdrant service", style="bold red")
+                console.print(_MSG_START_FAILED)
                 raise typer.Exit(1) from None
 
         except Exception as e:
             progress.update(task, description=f"❌ Error: {str(e)}")
-            console.print(f"❌ Error starting Qdrant: {e}", style="bold red")
+            console.print(
+                f"❌ Error starting Qdrant: {e}", style=_STYLE_ERROR, markup=False
+            )
             raise typer.Exit(1) from e
 
 
 def qdrant_stop() -> None:
     """Stop Qdrant vector database service."""
-    console.print("🛑 Stopping Qdrant vector database...", style="bold yellow")
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
-    manager = QdrantManager()
+    console.print(_MSG_STOPPING)
+
+    manager = _qdrant_manager()
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Stopping Qdrant service...", total=None)
 
@@ -89,14 +137,16 @@ def qdrant_stop() -> None:
 
             if success:
                 progress.update(task, description="✅ Qdrant stopped successfully")
-                console.print("✅ Qdrant service stopped", style="bold green")
+                console.print(_MSG_STOPPED)
             else:
                 progress.update(task, description="⚠️ Qdrant was not running")
-                console.print("⚠️ Qdrant service was not running", style="bold yellow")
+                console.print(_MSG_NOT_RUNNING)
 
         except Exception as e:
             progress.update(task, description=f"❌ Error: {str(e)}")
-            console.print(f"❌ Error stopping Qdrant: {e}", style="bold red")
+            console.print(
+                f"❌ Error stopping Qdrant: {e}", style=_STYLE_ERROR, markup=False
+            )
             raise typer.Exit(1) from e
 
 
@@ -104,7 +154,11 @@ def qdrant_status(
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ) -> None:
     """Show Qdrant service status."""
-    manager = QdrantManager()
+    from rich.table import Table
+
+    from heimdall.cognitive_system.service_manager import ServiceStatus
+
+    manager = _qdrant_manager()
     status = manager.get_status()
 
     if json_output:
@@ -117,35 +171,37 @@ def qdrant_status(
             "health_status": status.health_status,
             "error": status.error,
         }
-        console.print(json.dumps(status_data, indent=2))
+        write_json(status_data)
         return
 
     # Rich formatted output
     if status.status == ServiceStatus.RUNNING:
-        console.print("🟢 Qdrant is running", style="bold green")
+        status_line = _MSG_STATUS_RUNNING
     elif status.status == ServiceStatus.STOPPED:
-        console.print("🔴 Qdrant is stopped", style="bold red")
+        status_line = _MSG_STATUS_STOPPED
     else:
-        console.print("🟡 Qdrant status unknown", style="bold yellow")
+        status_line = _MSG_STATUS_UNKNOWN
+
+    # Status table, built from rows computed up front
+    rows: list[tuple[str, RenderableType]] = [
+        ("Status", status.status.value),
+        ("Port", str(status.port) if status.port else "N/A"),
+        ("PID", str(status.pid) if status.pid else "N/A"),
+        ("Container ID", status.container_id or "N/A"),
+        ("Uptime", format_uptime(status.uptime_seconds)),
+        ("Health", status.health_status or "Unknown"),
+    ]
+    if status.error:
+        # Docker and process errors are shown verbatim, never as Rich markup
+        rows.append(("Error", Text(status.error)))
 
-    # Status table
     status_table = Table(title="Qdrant Service Status")
     status_table.add_column("Property", style="cyan")
     status_table.add_column("Value", style="white")
+    for row in rows:
+        status_table.add_row(*row)
 
-    status_table.add_row("Status", status.status.value)
-    status_table.add_row("Port", str(status.port) if status.port else "N/A")
-    status_table.add_row("PID", str(status.pid) if status.pid else "N/A")
-    status_table.add_row("Container ID", status.container_id or "N/A")
-    status_table.add_row(
-        "Uptime", f"{status.uptime_seconds}s" if status.uptime_seconds else "N/A"
-    )
-    status_table.add_row("Health", status.health_status or "Unknown")
-
-    if status.error:
-        status_table.add_row("Error", status.error)
-
-    console.print(status_table)
+    console.print(Group(status_line, status_table))
 
 
 def qdrant_logs(
@@ -153,30 +209,36 @@ def qdrant_logs(
     follow: bool = typer.Option(False, "-f", help="Follow log output"),
 ) -> None:
     """Show Qdrant service logs."""
-    manager = QdrantManager()
+    manager = _qdrant_manager()
 
     try:
         logs = manager.get_logs(lines=lines, follow=follow)
 
         if follow:
-            console.print(
-                "📄 Following Qdrant logs (Ctrl+C to stop)...", style="bold blue"
-            )
-            console.print("-" * 60)
-
+            console.print(_MSG_FOLLOWING_LOGS)
+            console.print(_LOG_SEPARATOR)
+
+            # Log lines are written straight to stdout: Rich would parse each
+            # one for markup, and following logs needs each line flushed as it
+            # arrives
+            write = sys.stdout.write
+            flush = sys.stdout.flush
             try:
                 for log_line in logs:
-                    console.print(log_line.rstrip())
+                    write(log_line.rstrip() + "\n")
+                    flush()
             except KeyboardInterrupt:
-                console.print("\n⏹️ Stopped following logs", style="bold yellow")
+                console.print(_MSG_STOPPED_FOLLOWING)
 
         else:
-            console.print(f"📄 Last {lines} lines from Qdrant logs:", style="bold blue")
-            console.print("-" * 60)
+            console.print(f"📄 Last {lines} lines from Qdrant logs:", style=_STYLE_INFO)
+            console.print(_LOG_SEPARATOR)
 
-            for log_line in logs:
-                console.print(log_line.rstrip())
+            sys.stdout.write("".join(f"{log_line.rstrip()}\n" for log_line in logs))
+            sys.stdout.flush()
 
     except Exception as e:
-        console.print(f"❌ Error retrieving logs: {e}", style="bold red")
+        console.print(
+            f"❌ Error retrieving logs: {e}", style=_STYLE_ERROR, markup=False
+        )
         raise typer.Exit(1) from e
@@ -5,9 +5,12 @@ Shared formatting functions for CLI and interactive shell.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
+_PATTERN_ICONS = {"cochange": "🔄", "hotspot": "🔥", "solution": "💡"}
+
 
 def format_source_info(memory: Any) -> str:
     """
@@ -69,8 +72,7 @@ def format_source_info(memory: Any) -> str:
             repo_name = "repository"
 
         # Add specific pattern details
-        pattern_icons = {"cochange": "🔄", "hotspot": "🔥", "solution": "💡"}
-        icon = pattern_icons.get(pattern_type, "📊")
+        icon = _PATTERN_ICONS.get(pattern_type, "📊")
 
         # Show file names for cochange patterns
         if pattern_type == "cochange":
@@ -188,3 +190,42 @@ def format_memory_results_json(result_data: dict[str, Any]) -> str:
                 formatted_results["memories"][memory_type].append(memory_data)
 
     return json.dumps(formatted_results, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_json(data: Any) -> None:
+    """
+    Write data to stdout as indented JSON.
+
+    Bypasses Rich so the output is not scanned for markup or wrapped to the
+    terminal width, which keeps it machine-readable and avoids a second pass
+    over large payloads.
+
+    Args:
+        data: JSON-serializable data to write
+    """
+    sys.stdout.write(json.dumps(data, indent=2))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def format_uptime(seconds: float | None) -> str:
+    """
+    Format a service uptime for display.
+
+    Args:
+        seconds: Uptime in seconds, or None when the service is not running
+
+    Returns:
+        Uptime such as "2h 05m", "4m 12s" or "9.5s", or "N/A"
+    """
+    if seconds is None:
+        return "N/A"
+
+    # Round first so values such as 59.96 roll over to the next unit
+    minutes, secs = divmod(round(seconds, 1), 60)
+    if not minutes:
+        return f"{secs:.1f}s"
+    hours, minutes = divmod(int(minutes), 60)
+    if not hours:
+        return f"{minutes}m {int(secs):02d}s"
+    return f"{hours}h {minutes:02d}m"
@@ -6,11 +6,12 @@ with rich formatting, command completion, and intuitive cognitive operations.
 """
 
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from typing import Any
 
 from prompt_toolkit import PromptSession
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.completion import (
     Completer,
     Completion,
@@ -20,14 +21,84 @@ from prompt_toolkit.completion import (
 from prompt_toolkit.document import Document
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.styles import Style
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
 from cognitive_memory.core.interfaces import CognitiveSystem
+from cognitive_memory.core.memory import BridgeMemory
 from heimdall.display_utils import format_source_info
 from heimdall.operations import CognitiveOperations
 
+# Extensions accepted by MarkdownMemoryLoader, used to label path completions
+_MARKDOWN_SUFFIXES = (".md", ".markdown", ".mdown", ".mkd")
+
+# Indentation applied to every content preview line in memory listings
+_PREVIEW_INDENT = "   "
+_PREVIEW_NEWLINE = "\n" + _PREVIEW_INDENT
+
+_EXIT_COMMANDS = frozenset(("quit", "exit", "q", "bye"))
+
+# Commands whose positional argument is completed as a filesystem path
+_PATH_COMMANDS = frozenset(("load", "git-load"))
+
+# Rows of the shell help table: (command, description, example)
+_HELP_COMMANDS = (
+    (
+        "store <text>",
+        "Store new experience",
+        "store 'Working on neural networks'",
+    ),
+    (
+        "retrieve <query> [--full]",
+        "Retrieve all memory types (core/peripheral/bridge)",
+        "retrieve 'machine learning' --full",
+    ),
+    (
+        "recall <query> [--full]",
+        "Same as retrieve",
+        "recall 'debugging issues' --full",
+    ),
+    (
+        "bridges <query>",
+        "Focus on bridge connections only",
+        "bridges 'programming'",
+    ),
+    ("connect <query>", "Same as bridges", "connect 'algorithms'"),
+    ("status", "Show system status", "status"),
+    ("config", "Show configuration", "config"),
+    ("consolidate", "Organize memories", "consolidate"),
+    ("session", "Show session stats", "session"),
+    (
+        "load <file> [--recursive]",
+        "Load memories from file or directory",
+        "load docs/ --recursive",
+    ),
+    (
+        "git-load <repo> [--dry-run]",
+        "Load git repository patterns",
+        "git-load /path/to/repo --dry-run",
+    ),
+    (
+        "git-status [repo]",
+        "Show git pattern analysis status",
+        "git-status /path/to/repo",
+    ),
+    (
+        "git-patterns <query> [--type]",
+        "Search git patterns",
+        "git-patterns auth --type cochange",
+    ),
+    ("clear", "Clear screen", "clear"),
+    ("help", "Show this help", "help"),
+    ("quit", "Exit shell", "quit"),
+)
+
+_HELP_TIP = (
+    "\n[dim]💡 Use TAB for command and path completion. "
+    "For example: 'load docs/' + TAB[/dim]"
+)
+
 
 class CognitiveShellCompleter(Completer):
     """
@@ -72,6 +143,14 @@ class CognitiveShellCompleter(Completer):
         # Recall/retrieve command specific flags
         self.recall_flags = ["--full"]
 
+        # Flags offered per command, resolved once rather than on every keystroke
+        self.command_flags = {
+            "load": self.load_flags,
+            "git-load": [*self.load_flags, "--time-window", "--refresh"],
+            "retrieve": self.recall_flags,
+            "recall": self.recall_flags,
+        }
+
     def get_completions(
         self, document: Document, complete_event: Any
     ) -> Generator[Completion]:
@@ -91,7 +170,8 @@ class CognitiveShellCompleter(Completer):
             yield from self.command_completer.get_completions(document, complete_event)
             return
 
-        if command in ["load", "git-load", "retrieve", "recall"]:
+        flags = self.command_flags.get(command)
+        if flags is not None:
             # Special handling for commands with flags
             if len(words) >= 2:
                 # Get the current word being typed
@@ -99,15 +179,6 @@ class CognitiveShellCompleter(Completer):
 
                 # Check if it's a flag
                 if current_word.startswith("-"):
-                    if command in ["load", "git-load"]:
-                        flags = self.load_flags.copy()
-                        if command == "git-load":
-                            flags.extend(["--time-window", "--refresh"])
-                    elif command in ["retrieve", "recall"]:
-                        flags = self.recall_flags.copy()
-                    else:
-                        flags = []
-
                     for flag in flags:
                         if flag.startswith(current_word):
                             yield Completion(
@@ -116,7 +187,7 @@ class CognitiveShellCompleter(Completer):
                                 display=flag,
                                 display_meta="flag option",
                             )
-                elif command in ["load", "git-load"]:
+                elif command in _PATH_COMMANDS:
                     # Path completion for load command
                     # Create a document with just the path part
                     if text.endswith(" "):
@@ -145,12 +216,9 @@ class CognitiveShellCompleter(Completer):
                                                 meta = "git repository"
                                             else:
                                                 meta = "directory"
-                                        elif full_path.suffix.lower() in [
-                                            ".md",
-                                            ".markdown",
-                                            ".mdown",
-                                            ".mkd",
-                                        ]:
+                                        elif full_path.name.lower().endswith(
+                                            _MARKDOWN_SUFFIXES
+                                        ):
                                             meta = "markdown file"
                                         else:
                                             meta = "file"
@@ -227,11 +295,43 @@ class InteractiveShell:
         self.prompt_session: PromptSession[str] = PromptSession(
             history=FileHistory(str(history_file)),
             enable_history_search=True,
+            # Offer the rest of a matching earlier command inline (accept with →)
+            auto_suggest=AutoSuggestFromHistory(),
             style=self.prompt_style,
             completer=self.completer,
             complete_while_typing=True,
         )
 
+        # Commands that take no arguments, dispatched by exact name
+        self._simple_commands: dict[str, Callable[[], None]] = {
+            "help": self._show_help,
+            "h": self._show_help,
+            "?": self._show_help,
+            "status": self._show_status,
+            "stats": self._show_status,
+            "config": self._show_config,
+            "settings": self._show_config,
+            "consolidate": self._consolidate_memories,
+            "organize": self._consolidate_memories,
+            "session": self._show_session_summary,
+            "summary": self._show_session_summary,
+            "clear": self.console.clear,
+            "cls": self.console.clear,
+        }
+
+        # Commands that take arguments, dispatched by their first word
+        self._argument_commands: dict[str, Callable[[str], None]] = {
+            "store": self._cmd_store,
+            "retrieve": self._cmd_retrieve,
+            "recall": self._cmd_retrieve,
+            "bridges": self._cmd_bridges,
+            "connect": self._cmd_bridges,
+            "load": self._cmd_load,
+            "git-load": self._cmd_git_load,
+            "git-status": self._cmd_git_status,
+            "git-patterns": self._cmd_git_patterns,
+        }
+
     def run(self) -> None:
         """Run the interactive shell."""
         # Only show welcome message if running in an interactive terminal
@@ -239,24 +339,26 @@ class InteractiveShell:
             self._show_welcome()
 
         while True:
+            # Reading input and running the command are guarded separately so
+            # each try covers only the errors its own step can raise
             try:
                 # Use prompt_toolkit for professional shell experience with history
                 command = self.prompt_session.prompt(
                     [("class:prompt", f"\n{self.prompt_text}> ")],  # \n for spacing
                 ).strip()
+            except (KeyboardInterrupt, EOFError):
+                self.console.print("\n[bold yellow]👋 Goodbye![/bold yellow]")
+                break
 
-                if not command:
-                    continue
+            if not command:
+                continue
 
+            try:
                 if self._handle_command(command):
                     break
-
             except KeyboardInterrupt:
                 self.console.print("\n[bold yellow]👋 Goodbye![/bold yellow]")
                 break
-            except EOFError:
-                self.console.print("\n[bold yellow]👋 Goodbye![/bold yellow]")
-                break
             except Exception as e:
                 self.console.print(f"[bold red]❌ Error: {e}[/bold red]")
 
@@ -290,171 +392,116 @@ class InteractiveShell:
         Returns:
             bool: True if should exit shell
         """
-        # Store original command for file path handling
-        original_command = command
-        command = command.lower()
+        # Split off the verb once; arguments keep their original case so
+        # queries and file paths are passed through unchanged
+        parts = command.split(maxsplit=1)
+        if not parts:
+            return False
+        verb = parts[0].lower()
+        args = parts[1] if len(parts) > 1 else ""
 
         # Exit commands
-        if command in ["quit", "exit", "q", "bye"]:
+        if verb in _EXIT_COMMANDS and not args:
             self._show_session_summary()
             return True
 
-        # Help command
-        elif command in ["help", "h", "?"]:
-            self._show_help()
+        # Help, status, config and other argument-free commands
+        simple_handler = self._simple_commands.get(verb)
+        if simple_handler is not None and not args:
+            simple_handler()
+            return False
 
-        # Store experience
-        elif command.startswith("store "):
-            # Use original command to preserve case and formatting
-            text = original_command[6:].strip()
-            if text:
-                self._store_experience(text)
-            else:
-                self.console.print(
-                    "[bold red]❌ Please provide text to store[/bold red]"
-                )
-
-        # Retrieve memories
-        elif command.startswith("retrieve ") or command.startswith("recall "):
-            # Use original command to preserve case in queries
-            if " " in original_command:
-                args = original_command.split(" ", 1)[1].strip().split()
-                # Check for --full flag
-                full_output = "--full" in args
-                # Remove --full from args to get query
-                query_parts = [arg for arg in args if arg != "--full"]
-                query = " ".join(query_parts)
-
-                if query:
-                    self._retrieve_memories(query, full_output=full_output)
-                else:
-                    self.console.print("[bold red]❌ Please provide a query[/bold red]")
-            else:
-                self.console.print("[bold red]❌ Please provide a query[/bold red]")
-
-        # Bridge discovery
-        elif command.startswith("bridges ") or command.startswith("connect "):
-            # Use original command to preserve case in queries
-            query = (
-                original_command.split(" ", 1)[1].strip()
-                if " " in original_command
-                else ""
+        # Commands that take arguments
+        handler = self._argument_commands.get(verb)
+        if handler is not None:
+            handler(args)
+        else:
+            self.console.print(
+                f"[bold red]❌ Unknown command: {command.lower()}[/bold red]"
             )
-            if query:
-                self._discover_bridges(query)
-            else:
-                self.console.print(
-                    "[bold red]❌ Please provide a query for bridge discovery[/bold red]"
-                )
+            self.console.print("[dim]Type 'help' for available commands[/dim]")
 
-        # System status
-        elif command in ["status", "stats"]:
-            self._show_status()
+        return False
 
-        # System configuration
-        elif command in ["config", "settings"]:
-            self._show_config()
+    def _cmd_store(self, args: str) -> None:
+        """Handle the store command."""
+        if args:
+            self._store_experience(args)
+        else:
+            self.console.print("[bold red]❌ Please provide text to store[/bold red]")
 
-        # Memory consolidation
-        elif command in ["consolidate", "organize"]:
-            self._consolidate_memories()
+    def _cmd_retrieve(self, args: str) -> None:
+        """Handle the retrieve/recall commands."""
+        words = args.split()
+        # Check for --full flag and remove it from the query
+        full_output = "--full" in words
+        query = " ".join(word for word in words if word != "--full")
 
-        # Session statistics
-        elif command in ["session", "summary"]:
-            self._show_session_summary()
+        if query:
+            self._retrieve_memories(query, full_output=full_output)
+        else:
+            self.console.print("[bold red]❌ Please provide a query[/bold red]")
 
-        # Clear screen
-        elif command in ["clear", "cls"]:
-            self.console.clear()
+    def _cmd_bridges(self, args: str) -> None:
+        """Handle the bridges/connect commands."""
+        if args:
+            self._discover_bridges(args)
+        else:
+            self.console.print(
+                "[bold red]❌ Please provide a query for bridge discovery[/bold red]"
+            )
 
-        # Load memories from file
-        elif command.startswith("load"):
-            # Handle "load" command with or without arguments
-            if command == "load":
-                self.console.print("[bold red]❌ Please provide a file path[/bold red]")
-                self.console.print("[dim]Usage: load <file_path> [--recursive][/dim]")
-            else:
-                # Use original command to preserve case-sensitive file paths
-                args = original_command[5:].strip().split()
-                if args:
-                    file_path = args[0]
-                    recursive = "--recursive" in args or "-r" in args
-                    self._load_memories(file_path, recursive=recursive)
-                else:
-                    self.console.print(
-                        "[bold red]❌ Please provide a file path[/bold red]"
-                    )
+    def _cmd_load(self, args: str) -> None:
+        """Handle the load command."""
+        words = args.split()
+        if words:
+            recursive = "--recursive" in words or "-r" in words
+            self._load_memories(words[0], recursive=recursive)
+        else:
+            self.console.print("[bold red]❌ Please provide a file path[/bold red]")
+            self.console.print("[dim]Usage: load <file_path> [--recursive][/dim]")
+
+    def _cmd_git_load(self, args: str) -> None:
+        """Handle the git-load command."""
+        words = args.split()
+        if words:
+            self._load_git_patterns(words[0], dry_run="--dry-run" in words)
+        else:
+            self.console.print(
+                "[bold red]❌ Please provide a repository path[/bold red]"
+            )
+            self.console.print(
+                "[dim]Usage: git-load <repo_path> [--dry-run] [--time-window 3m][/dim]"
+            )
 
-        # Git commands
-        elif command.startswith("git-load"):
-            # Handle "git-load" command with or without arguments
-            if command == "git-load":
-                self.console.print(
-                    "[bold red]❌ Please provide a repository path[/bold red]"
-                )
-                self.console.print(
-                    "[dim]Usage: git-load <repo_path> [--dry-run] [--time-window 3m][/dim]"
-                )
-            else:
-                # Use original command to preserve case-sensitive paths
-                args = original_command[8:].strip().split()
-                if args:
-                    repo_path = args[0]
-                    dry_run = "--dry-run" in args
-                    self._load_git_patterns(repo_path, dry_run=dry_run)
-                else:
-                    self.console.print(
-                        "[bold red]❌ Please provide a repository path[/bold red]"
-                    )
+    def _cmd_git_status(self, args: str) -> None:
+        """Handle the git-status command."""
+        words = args.split()
+        self._show_git_status(words[0] if words else None)
 
-        elif command.startswith("git-status"):
-            # Handle "git-status" command
-            args = (
-                original_command[10:].strip().split()
-                if len(original_command) > 10
-                else []
+    def _cmd_git_patterns(self, args: str) -> None:
+        """Handle the git-patterns command."""
+        words = args.split()
+        if not words:
+            self.console.print("[bold red]❌ Please provide a search query[/bold red]")
+            self.console.print(
+                "[dim]Usage: git-patterns <query> [--type cochange|hotspot|solution][/dim]"
             )
-            git_repo_path = args[0] if args else None
-            self._show_git_status(git_repo_path)
+            return
 
-        elif command.startswith("git-patterns"):
-            # Handle "git-patterns" command
-            if command == "git-patterns":
-                self.console.print(
-                    "[bold red]❌ Please provide a search query[/bold red]"
-                )
-                self.console.print(
-                    "[dim]Usage: git-patterns <query> [--type cochange|hotspot|solution][/dim]"
-                )
+        # Extract query (everything that's not a flag)
+        query_parts = []
+        pattern_type = None
+        i = 0
+        while i < len(words):
+            if words[i] == "--type" and i + 1 < len(words):
+                pattern_type = words[i + 1]
+                i += 2
             else:
-                # Parse arguments
-                args = original_command[12:].strip().split()
-                if args:
-                    # Extract query (everything that's not a flag)
-                    query_parts = []
-                    pattern_type = None
-                    i = 0
-                    while i < len(args):
-                        if args[i] == "--type" and i + 1 < len(args):
-                            pattern_type = args[i + 1]
-                            i += 2
-                        else:
-                            query_parts.append(args[i])
-                            i += 1
-
-                    query = " ".join(query_parts)
-                    self._search_git_patterns(query, pattern_type)
-                else:
-                    self.console.print(
-                        "[bold red]❌ Please provide a search query[/bold red]"
-                    )
+                query_parts.append(words[i])
+                i += 1
 
-        # Unknown command
-        else:
-            self.console.print(f"[bold red]❌ Unknown command: {command}[/bold red]")
-            self.console.print("[dim]Type 'help' for available commands[/dim]")
-
-        return False
+        self._search_git_patterns(" ".join(query_parts), pattern_type)
 
     def _show_help(self) -> None:
         """Show help information."""
@@ -465,67 +512,11 @@ class InteractiveShell:
         help_table.add_column("Description", style="white")
         help_table.add_column("Example", style="dim")
 
-        commands = [
-            (
-                "store <text>",
-                "Store new experience",
-                "store 'Working on neural networks'",
-            ),
-            (
-                "retrieve <query> [--full]",
-                "Retrieve all memory types (core/peripheral/bridge)",
-                "retrieve 'machine learning' --full",
-            ),
-            (
-                "recall <query> [--full]",
-                "Same as retrieve",
-                "recall 'debugging issues' --full",
-            ),
-            (
-                "bridges <query>",
-                "Focus on bridge connections only",
-                "bridges 'programming'",
-            ),
-            ("connect <query>", "Same as bridges", "connect 'algorithms'"),
-            ("status", "Show system status", "status"),
-            ("config", "Show configuration", "config"),
-            ("consolidate", "Organize memories", "consolidate"),
-            ("session", "Show session stats", "session"),
-            (
-                "load <file> [--recursive]",
-                "Load memories from file or directory",
-                "load docs/ --recursive",
-            ),
-            (
-                "git-load <repo> [--dry-run]",
-                "Load git repository patterns",
-                "git-load /path/to/repo --dry-run",
-            ),
-            (
-                "git-status [repo]",
-                "Show git pattern analysis status",
-                "git-status /path/to/repo",
-            ),
-            (
-                "git-patterns <query> [--type]",
-                "Search git patterns",
-                "git-patterns auth --type cochange",
-            ),
-            ("clear", "Clear screen", "clear"),
-            ("help", "Show this help", "help"),
-            ("quit", "Exit shell", "quit"),
-        ]
-
-        for cmd, desc, example in commands:
+        for cmd, desc, example in _HELP_COMMANDS:
             help_table.add_row(cmd, desc, example)
 
-        self.console.print(help_table)
-
-        # Add completion tip
-        self.console.print(
-            "\n[dim]💡 Use TAB for command and path completion. "
-            "For example: 'load docs/' + TAB[/dim]"
-        )
+        # Table and completion tip go out in a single write
+        self.console.print(Group(help_table, _HELP_TIP))
 
     def _store_experience(self, text: str) -> None:
         """Store a new experience using operations layer."""
@@ -585,6 +576,9 @@ class InteractiveShell:
                 f"\n[bold blue]📋 Retrieved {total_results} memories for: '{query}'[/bold blue]"
             )
 
+            # Bridge results often re-surface core memories, so share source
+            # lookups across all panels printed for this query
+            source_cache: dict[str, str] = {}
             for memory_type, memories in memories_by_type.items():
                 if memories:
                     # Choose appropriate styling for each memory type
@@ -604,11 +598,15 @@ class InteractiveShell:
                     # Use bridge-specific formatting for bridge memories
                     if memory_type == "bridge":
                         content = self._format_bridges(
-                            memories, full_output=full_output
+                            memories,
+                            full_output=full_output,
+                            source_cache=source_cache,
                         )
                     else:
                         content = self._format_memories(
-                            memories, full_output=full_output
+                            memories,
+                            full_output=full_output,
+                            source_cache=source_cache,
                         )
 
                     type_panel = Panel(
@@ -973,37 +971,55 @@ class InteractiveShell:
 
         self.console.print(summary_table)
 
-    def _format_memories(self, memories: list[Any], full_output: bool = False) -> str:
+    def _source_info(
+        self, memory: Any, source_cache: dict[str, str] | None = None
+    ) -> str:
+        """Return format_source_info for a memory, memoized by memory ID."""
+        if source_cache is None:
+            return format_source_info(memory)
+        memory_id = memory.id
+        source_info = source_cache.get(memory_id)
+        if source_info is None:
+            source_info = source_cache[memory_id] = format_source_info(memory)
+        return source_info
+
+    def _format_memories(
+        self,
+        memories: list[Any],
+        full_output: bool = False,
+        source_cache: dict[str, str] | None = None,
+    ) -> str:
         """Format memories for display with intelligent multiline handling."""
         lines = []
         for i, memory in enumerate(memories, 1):
+            content = memory.content
+            metadata = memory.metadata
+
             # Get title from metadata if available
-            title = memory.metadata.get("title", "")
+            title = metadata.get("title", "")
 
             # Smart content preview
             if full_output:
-                content_preview = memory.content.strip()
+                content_preview = content.strip()
             else:
-                content_preview = self._create_content_preview(memory.content, title)
+                content_preview = self._create_content_preview(content, title)
 
             # Memory header with type and title
-            if title:
-                lines.append(f"{i}. [{memory.memory_type}] {title}")
-            else:
-                lines.append(f"{i}. [{memory.memory_type}] Memory")
+            lines.append(f"{i}. [{memory.memory_type}] {title or 'Memory'}")
 
-            # Content preview with proper indentation
-            for line in content_preview.split("\n"):
-                lines.append(f"   {line}")
+            # Content preview with proper indentation, indented in one pass
+            lines.append(
+                _PREVIEW_INDENT + content_preview.replace("\n", _PREVIEW_NEWLINE)
+            )
 
             # Metadata line
-            score = memory.metadata.get("similarity_score", memory.strength)
+            score = metadata.get("similarity_score", memory.strength)
             lines.append(
                 f"   ID: {memory.id}, Level: L{memory.hierarchy_level}, Strength: {score:.2f}"
             )
 
             # Source information
-            source_info = format_source_info(memory)
+            source_info = self._source_info(memory, source_cache)
             if source_info:
                 lines.append(f"   Source: {source_info}")
 
@@ -1049,13 +1065,16 @@ class InteractiveShell:
 
         return "\n".join(preview_lines)
 
-    def _format_bridges(self, bridges: list[Any], full_output: bool = False) -> str:
+    def _format_bridges(
+        self,
+        bridges: list[Any],
+        full_output: bool = False,
+        source_cache: dict[str, str] | None = None,
+    ) -> str:
         """Format bridge connections for display (legacy method for compatibility)."""
         lines = []
         for i, bridge_item in enumerate(bridges, 1):
-            # Handle BridgeMemory objects properly
-            if hasattr(bridge_item, "memory"):
-                # This is a BridgeMemory object
+            if isinstance(bridge_item, BridgeMemory):
                 memory = bridge_item.memory
                 if full_output:
                     content = memory.content.strip()
@@ -1075,7 +1094,7 @@ class InteractiveShell:
                     lines.append(f"   {bridge_item.explanation}")
 
                 # Add source information for bridge memories
-                source_info = format_source_info(memory)
+                source_info = self._source_info(memory, source_cache)
                 if source_info:
                     lines.append(f"   Source: {source_info}")
             else:
@@ -1095,7 +1114,7 @@ class InteractiveShell:
                 )
 
                 # Add source information for bridge memories (fallback case)
-                source_info = format_source_info(bridge_item)
+                source_info = self._source_info(bridge_item, source_cache)
                 if source_info:
                     lines.append(f"   Source: {source_info}")
             lines.append("")  # Empty line for separation
@@ -1125,14 +1144,12 @@ class InteractiveShell:
                 content_preview = self._create_content_preview(content, title)
 
             # Memory header with type and title
-            if title:
-                lines.append(f"{i}. [{memory_type}] {title}")
-            else:
-                lines.append(f"{i}. [{memory_type}] Memory")
+            lines.append(f"{i}. [{memory_type}] {title or 'Memory'}")
 
-            # Content preview with proper indentation
-            for line in content_preview.split("\n"):
-                lines.append(f"   {line}")
+            # Content preview with proper indentation, indented in one pass
+            lines.append(
+                _PREVIEW_INDENT + content_preview.replace("\n", _PREVIEW_NEWLINE)
+            )
 
             # Metadata line
             score = metadata.get("similarity_score", strength)
@@ -10,10 +10,92 @@ This is the single source of truth for cognitive memory operations.
 
 import json
 import os
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from cognitive_memory.core.interfaces import CognitiveSystem
+from loguru import logger
+
+if TYPE_CHECKING:
+    from cognitive_memory.core.config import SystemConfig
+    from cognitive_memory.core.interfaces import CognitiveSystem
+
+# Hierarchy levels as reported in hierarchy_distribution, indexed by level
+_LEVEL_KEYS = ("L0", "L1", "L2")
+
+
+def _count_hierarchy_levels(memories: list[Any], counts: list[int]) -> None:
+    """Add each memory's hierarchy level to counts, indexed by level."""
+    for memory in memories:
+        level = memory.hierarchy_level
+        if level in (0, 1, 2):
+            counts[level] += 1
+
+
+def _iter_source_files(
+    directory: str | Path, suffixes: set[str], relative_dir: str = ""
+) -> Iterator[tuple[str, str]]:
+    """
+    Yield files under directory whose extension is in suffixes.
+
+    Entries are read with os.scandir, so each entry's type comes from the
+    directory read instead of a separate stat() call. Symlinked directories
+    are followed and unreadable directories are skipped, as with os.walk.
+    Each directory's entries are sorted by name and subdirectories are
+    descended in place, which yields paths in the same order as sorting the
+    complete list would. Relative paths are built up while descending, so
+    callers never need Path.relative_to.
+
+    Args:
+        directory: Directory to search
+        suffixes: Lower-case dotted extensions to match (e.g. {".md"})
+        relative_dir: Path of directory relative to the search root
+
+    Yields:
+        Tuple of (file path, file path relative to the search root)
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        relative_path = (
+            os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+        )
+        if entry.is_dir(follow_symlinks=True):
+            yield from _iter_source_files(entry.path, suffixes, relative_path)
+        elif os.path.splitext(entry.name)[1].lower() in suffixes:
+            yield entry.path, relative_path
+
+
+def _try_load_from_source(
+    loader: Any, source_path: str, **kwargs: Any
+) -> tuple[list[Any] | None, str | None]:
+    """
+    Load memories from a source without storing them.
+
+    Loader failures are returned rather than raised, so per-file loops can
+    branch on the result instead of wrapping every call in try/except.
+
+    Args:
+        loader: Memory loader to use
+        source_path: Path to the source to load
+        **kwargs: Loader-specific parameters
+
+    Returns:
+        Tuple of (memories, None) on success or (None, error message)
+    """
+    try:
+        return loader.load_from_source(source_path, **kwargs), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _level_distribution(counts: list[int]) -> dict[str, int]:
+    """Convert per-level counts into a hierarchy_distribution dict."""
+    return dict(zip(_LEVEL_KEYS, counts, strict=True))
 
 
 class CognitiveOperations:
@@ -26,7 +108,7 @@ class CognitiveOperations:
     This class contains the single source of truth for all cognitive memory business logic.
     """
 
-    def __init__(self, cognitive_system: CognitiveSystem):
+    def __init__(self, cognitive_system: "CognitiveSystem"):
         """
         Initialize operations with cognitive system instance.
 
@@ -34,6 +116,24 @@ class CognitiveOperations:
             cognitive_system: The cognitive system interface to use
         """
         self.cognitive_system = cognitive_system
+        self._config: SystemConfig | None = None
+
+    def _get_config(self) -> "SystemConfig":
+        """
+        Get the system configuration, loading it on first use.
+
+        get_config() re-reads the environment and .env file and re-validates
+        on every call, so the result is kept for the lifetime of this instance
+        (one CLI invocation, shell session or MCP server).
+
+        Returns:
+            SystemConfig: Complete system configuration
+        """
+        if self._config is None:
+            from cognitive_memory.core.config import get_config
+
+            self._config = get_config()
+        return self._config
 
     def store_experience(
         self,
@@ -47,7 +147,8 @@ class CognitiveOperations:
         Args:
             text: Experience text to store
             context: Optional context information as dictionary
-            context_json: Optional context as JSON string (alternative to context dict)
+            context_json: Optional context as JSON string; keys given in context
+                override the ones parsed from it
 
         Returns:
             Dict containing:
@@ -66,11 +167,11 @@ class CognitiveOperations:
                 "error": "Empty text provided",
             }
 
-        # Parse JSON context if provided
-        if context_json and not context:
+        # Parse JSON context if provided, letting explicit context keys win
+        if context_json:
             try:
-                context = json.loads(context_json)
-            except json.JSONDecodeError as e:
+                context = {**json.loads(context_json), **(context or {})}
+            except (ValueError, TypeError) as e:
                 return {
                     "success": False,
                     "memory_id": None,
@@ -155,7 +256,7 @@ class CognitiveOperations:
                 query=query, types=types, max_results=limit
             )
 
-            total_count = sum(len(memories) for memories in results.values())
+            total_count = sum(map(len, results.values()))
 
             # Keep the proper types - CognitiveMemory and BridgeMemory objects
             standardized_results = {
@@ -316,15 +417,13 @@ class CognitiveOperations:
             }
 
         try:
-            # Import necessary modules
-            from cognitive_memory.core.config import get_config
-            from cognitive_memory.loaders import MarkdownMemoryLoader
-
-            config = get_config()
+            config = self._get_config()
 
             # Create the appropriate loader
             loader: Any | Any  # Type will be MarkdownMemoryLoader or GitHistoryLoader
             if loader_type == "markdown":
+                from cognitive_memory.loaders import MarkdownMemoryLoader
+
                 loader = MarkdownMemoryLoader(config.cognitive)
             elif loader_type == "git":
                 from cognitive_memory.loaders import GitHistoryLoader
@@ -413,64 +512,54 @@ class CognitiveOperations:
                 "dry_run": dry_run,
             }
 
-        # Find all supported files in directory
-        markdown_files: list[Path] = []
+        # Find supported files; names are normalized to lower-case dotted
+        # suffixes, matching how loaders validate individual files
         extensions = loader.get_supported_extensions()
+        suffixes = {f".{ext.lower().lstrip('.')}" for ext in extensions}
 
-        for root, _dirs, files in os.walk(source_path_obj, followlinks=True):
-            for file in files:
-                if any(file.endswith(ext) for ext in extensions):
-                    markdown_files.append(Path(root) / file)
-
-        if not markdown_files:
-            return {
-                "success": False,
-                "memories_loaded": 0,
-                "connections_created": 0,
-                "processing_time": 0.0,
-                "hierarchy_distribution": {},
-                "memories_failed": 0,
-                "connections_failed": 0,
-                "files_processed": [],
-                "error": f"No {', '.join(extensions)} files found in directory: {source_path_obj}",
-                "dry_run": dry_run,
-            }
-
-        # Process files
+        # Process files one at a time: each reload deletes and re-stores memories
+        # through the shared cognitive system, whose storage backends are not
+        # safe to drive from several threads. The per-file totals below are a
+        # handful of integer adds, so aggregation is not worth vectorizing.
         total_memories_loaded = 0
         total_memories_deleted = 0
         total_connections_created = 0
         total_processing_time = 0.0
-        hierarchy_dist_combined = {"L0": 0, "L1": 0, "L2": 0}
+        level_counts = [0, 0, 0]
         total_memories_failed = 0
         total_connections_failed = 0
         files_processed = []
         total_success = True
+        files_found = 0
 
-        for markdown_file in sorted(markdown_files):
-            file_path_str = str(markdown_file)
-            relative_path = str(markdown_file.relative_to(source_path_obj))
+        # Files are processed as they are discovered rather than after a full
+        # walk, so large trees start loading immediately
+        for file_path_str, relative_path in _iter_source_files(
+            source_path_obj, suffixes
+        ):
+            files_found += 1
 
             # Validate individual file
             if not loader.validate_source(file_path_str):
+                logger.debug("Skipping {}: source validation failed", relative_path)
                 total_success = False
                 continue
 
             files_processed.append(relative_path)
 
-            if dry_run:
-                try:
-                    # Load memories without storing them
-                    memories = loader.load_from_source(file_path_str, **kwargs)
-
-                    # Count hierarchy distribution
-                    for memory in memories:
-                        level_key = f"L{memory.hierarchy_level}"
-                        if level_key in hierarchy_dist_combined:
-                            hierarchy_dist_combined[level_key] += 1
+            # Per-file progress uses loguru's deferred formatting, so it costs
+            # nothing beyond a level check unless LOG_LEVEL enables INFO
+            logger.info("Loading: {}", relative_path)
 
-                except Exception:
+            if dry_run:
+                # Load memories without storing them
+                memories, error = _try_load_from_source(loader, file_path_str, **kwargs)
+                if memories is None:
+                    logger.warning("Failed to analyze {}: {}", relative_path, error)
                     total_success = False
+                else:
+                    # Count hierarchy distribution
+                    _count_hierarchy_levels(memories, level_counts)
             else:
                 try:
                     # Perform atomic reload (delete existing + load new)
@@ -479,6 +568,11 @@ class CognitiveOperations:
                     )
 
                     if results["success"]:
+                        logger.info(
+                            "Loaded {} memories from {}",
+                            results["memories_loaded"],
+                            relative_path,
+                        )
                         total_memories_loaded += results["memories_loaded"]
                         total_memories_deleted += results.get("deleted_count", 0)
                         total_connections_created += results["connections_created"]
@@ -487,25 +581,40 @@ class CognitiveOperations:
                         total_connections_failed += results["connections_failed"]
 
                         # Aggregate hierarchy distribution
-                        if "hierarchy_distribution" in results:
-                            for level, count in results[
-                                "hierarchy_distribution"
-                            ].items():
-                                if level in hierarchy_dist_combined:
-                                    hierarchy_dist_combined[level] += count
+                        distribution = results.get("hierarchy_distribution", {})
+                        for level, key in enumerate(_LEVEL_KEYS):
+                            level_counts[level] += distribution.get(key, 0)
                     else:
+                        logger.warning(
+                            "Failed to load {}: {}", relative_path, results.get("error")
+                        )
                         total_success = False
 
-                except Exception:
+                except Exception as e:
+                    logger.warning("Failed to load {}: {}", relative_path, e)
                     total_success = False
 
+        if not files_found:
+            return {
+                "success": False,
+                "memories_loaded": 0,
+                "connections_created": 0,
+                "processing_time": 0.0,
+                "hierarchy_distribution": {},
+                "memories_failed": 0,
+                "connections_failed": 0,
+                "files_processed": [],
+                "error": f"No {', '.join(extensions)} files found in directory: {source_path_obj}",
+                "dry_run": dry_run,
+            }
+
         return {
             "success": total_success,
             "memories_loaded": total_memories_loaded,
             "memories_deleted": total_memories_deleted,
             "connections_created": total_connections_created,
             "processing_time": total_processing_time,
-            "hierarchy_distribution": hierarchy_dist_combined,
+            "hierarchy_distribution": _level_distribution(level_counts),
             "memories_failed": total_memories_failed,
             "connections_failed": total_connections_failed,
             "files_processed": files_processed,
@@ -539,18 +648,15 @@ class CognitiveOperations:
                 connections = loader.extract_connections(memories)
 
                 # Show hierarchy distribution
-                hierarchy_dist = {"L0": 0, "L1": 0, "L2": 0}
-                for memory in memories:
-                    level_key = f"L{memory.hierarchy_level}"
-                    if level_key in hierarchy_dist:
-                        hierarchy_dist[level_key] += 1
+                level_counts = [0, 0, 0]
+                _count_hierarchy_levels(memories, level_counts)
 
                 return {
                     "success": True,
                     "memories_loaded": len(memories),
                     "connections_created": len(connections),
                     "processing_time": 0.0,
-                    "hierarchy_distribution": hierarchy_dist,
+                    "hierarchy_distribution": _level_distribution(level_counts),
                     "memories_failed": 0,
                     "connections_failed": 0,
                     "files_processed": [source_path],
@@ -0,0 +1,32 @@
+"""
+Unit tests for heimdall display utilities.
+
+Tests the pure formatting helpers shared by the CLI and interactive shell.
+"""
+
+import pytest
+
+from heimdall.display_utils import format_uptime
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [
+        (None, "N/A"),
+        (0, "0.0s"),
+        (0.04, "0.0s"),
+        (9.54, "9.5s"),
+        (59.94, "59.9s"),
+        (59.96, "1m 00s"),
+        (60, "1m 00s"),
+        (252.7, "4m 12s"),
+        (3599.5, "59m 59s"),
+        (3599.96, "1h 00m"),
+        (3600, "1h 00m"),
+        (7500, "2h 05m"),
+        (90000, "25h 00m"),
+    ],
+)
+def test_format_uptime(seconds, expected):
+    """Test uptimes are formatted in the largest sensible units."""
+    assert format_uptime(seconds) == expected
@@ -106,6 +106,46 @@ class TestCognitiveOperations:
                 text, {"source": "json_test", "hierarchy_level": 1}
             )
 
+        def test_store_experience_context_overrides_json_context(
+            self, operations, mock_cognitive_system
+        ):
+            """Test explicit context keys are merged over the JSON context."""
+            # Arrange
+            mock_cognitive_system.store_experience.return_value = "mem_790"
+            text = "Test with both contexts"
+            context_json = '{"source": "json_test", "hierarchy_level": 1}'
+
+            # Act
+            result = operations.store_experience(
+                text, context={"hierarchy_level": 0}, context_json=context_json
+            )
+
+            # Assert
+            assert result["success"] is True
+            assert result["hierarchy_level"] == 0
+            mock_cognitive_system.store_experience.assert_called_once_with(
+                text, {"source": "json_test", "hierarchy_level": 0}
+            )
+
+        def test_store_experience_json_context_keeps_large_integers(
+            self, operations, mock_cognitive_system
+        ):
+            """Test JSON context integers wider than 64 bits are not truncated."""
+            # Arrange
+            mock_cognitive_system.store_experience.return_value = "mem_791"
+            big_id = 2**70
+
+            # Act
+            result = operations.store_experience(
+                "Test with big id", context_json=f'{{"ticket_id": {big_id}}}'
+            )
+
+            # Assert
+            assert result["success"] is True
+            mock_cognitive_system.store_experience.assert_called_once_with(
+                "Test with big id", {"ticket_id": big_id}
+            )
+
         def test_store_experience_empty_text(self, operations, mock_cognitive_system):
             """Test storage failure with empty text."""
             # Act
@@ -600,14 +640,13 @@ class TestCognitiveOperations:
 
         @patch("cognitive_memory.core.config.get_config")
         @patch("cognitive_memory.loaders.MarkdownMemoryLoader")
-        @patch("os.walk")
         def test_load_memories_directory_recursive(
             self,
-            mock_walk,
             mock_loader_class,
             mock_get_config,
             operations,
             mock_cognitive_system,
+            tmp_path,
         ):
             """Test directory loading with recursive option."""
             # Arrange
@@ -619,10 +658,9 @@ class TestCognitiveOperations:
             mock_loader.get_supported_extensions.return_value = [".md"]
             mock_loader_class.return_value = mock_loader
 
-            # Mock directory walking
-            mock_walk.return_value = [
-                ("/path/to/dir", [], ["file1.md", "file2.md", "ignore.txt"])
-            ]
+            # Create directory contents
+            for name in ["file1.md", "file2.md", "ignore.txt"]:
+                (tmp_path / name).write_text("# Test")
 
             mock_results = {
                 "success": True,
@@ -637,7 +675,7 @@ class TestCognitiveOperations:
 
             # Act
             # Let Path work normally - it's fine to use real Path objects
-            result = operations.load_memories("/path/to/dir", recursive=True)
+            result = operations.load_memories(str(tmp_path), recursive=True)
 
             # Assert
             assert result["success"] is True
@@ -788,17 +826,15 @@ class TestCognitiveOperations:
             assert result["error"] == "Loading error"
             assert result["dry_run"] is False
 
-        @patch.object(operations_module, "os")
-        def test_process_directory_no_files_found(self, mock_os, operations):
+        def test_process_directory_no_files_found(self, operations, tmp_path):
             """Test _process_directory when no supported files are found."""
             # Arrange
             mock_loader = Mock()
             mock_loader.get_supported_extensions.return_value = [".md"]
-            mock_os.walk.return_value = [
-                ("/path", [], ["file.txt", "other.pdf"])
-            ]  # No .md files
+            for name in ["file.txt", "other.pdf"]:  # No .md files
+                (tmp_path / name).write_text("content")
 
-            source_path_obj = Path("/path")
+            source_path_obj = tmp_path
 
             # Act
             result = operations._process_directory(
@@ -810,8 +846,50 @@ class TestCognitiveOperations:
             assert "No .md files found" in result["error"]
             assert result["files_processed"] == []
 
-        @patch.object(operations_module, "os")
-        def test_process_directory_file_validation_failure(self, mock_os, operations):
+        def test_process_directory_matches_extensions_case_insensitively(
+            self, operations, tmp_path
+        ):
+            """Test _process_directory finds files whose extension case differs."""
+            # Arrange
+            mock_loader = Mock()
+            mock_loader.get_supported_extensions.return_value = [".md"]
+            mock_loader.validate_source.return_value = True
+            mock_loader.load_from_source.return_value = []
+            (tmp_path / "nested").mkdir()
+            (tmp_path / "nested" / "NOTES.MD").write_text("# Notes")
+            (tmp_path / "skip.txt").write_text("content")
+
+            # Act
+            result = operations._process_directory(mock_loader, tmp_path, True, True)
+
+            # Assert
+            assert result["success"] is True
+            assert result["files_processed"] == [str(Path("nested") / "NOTES.MD")]
+
+        def test_process_directory_processes_files_in_sorted_order(
+            self, operations, tmp_path
+        ):
+            """Test _process_directory visits nested files in sorted path order."""
+            # Arrange
+            mock_loader = Mock()
+            mock_loader.get_supported_extensions.return_value = [".md"]
+            mock_loader.validate_source.return_value = True
+            mock_loader.load_from_source.return_value = []
+            for name in ["b.md", "a/z.md", "a/b/c.md", "c.md"]:
+                file_path = tmp_path / name
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text("# Test")
+
+            # Act
+            result = operations._process_directory(mock_loader, tmp_path, True, True)
+
+            # Assert
+            expected = sorted(
+                str(Path(name)) for name in ["a/b/c.md", "a/z.md", "b.md", "c.md"]
+            )
+            assert result["files_processed"] == expected
+
+        def test_process_directory_file_validation_failure(self, operations, tmp_path):
             """Test _process_directory with file validation failures."""
             # Arrange
             mock_loader = Mock()
@@ -819,9 +897,9 @@ class TestCognitiveOperations:
             mock_loader.validate_source.return_value = (
                 False  # All files fail validation
             )
-            mock_os.walk.return_value = [("/path", [], ["valid.md"])]
+            (tmp_path / "valid.md").write_text("# Valid")
 
-            source_path_obj = Path("/path")
+            source_path_obj = tmp_path
 
             # Act
             result = operations._process_directory(
@@ -833,16 +911,16 @@ class TestCognitiveOperations:
             assert result["memories_loaded"] == 0
             assert result["files_processed"] == []
 
-        @patch.object(operations_module, "os")
         def test_process_directory_mixed_success_failure(
-            self, mock_os, operations, mock_cognitive_system
+            self, operations, mock_cognitive_system, tmp_path
         ):
             """Test _process_directory with mixed success and failure results."""
             # Arrange
             mock_loader = Mock()
             mock_loader.get_supported_extensions.return_value = [".md"]
             mock_loader.validate_source.return_value = True
-            mock_os.walk.return_value = [("/path", [], ["success.md", "failure.md"])]
+            for name in ["success.md", "failure.md"]:
+                (tmp_path / name).write_text("# Test")
 
             # Mock different results for different files
             def mock_load_side_effect(loader, file_path, **kwargs):
@@ -863,7 +941,7 @@ class TestCognitiveOperations:
                 mock_load_side_effect
             )
 
-            source_path_obj = Path("/path")
+            source_path_obj = tmp_path
 
             # Act
             # Don't mock Path since it breaks path operations - let the real Path work
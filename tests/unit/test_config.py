@@ -14,6 +14,8 @@ import yaml
 from cognitive_memory.core.config import (
     SystemConfig,
     detect_project_config,
+    get_monitoring_config,
+    get_monitoring_target_path,
     get_project_id,
 )
 
@@ -364,6 +366,77 @@ services:
                 os.chdir(old_cwd)
 
 
+class TestMonitoringConfig:
+    """Test monitoring configuration from .heimdall/config.yaml and env."""
+
+    MONITORING_ENV = (
+        "MONITORING_TARGET_PATH",
+        "MONITORING_INTERVAL_SECONDS",
+        "MONITORING_IGNORE_PATTERNS",
+    )
+
+    @pytest.fixture
+    def project_root(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Create a project with a monitoring section and no monitoring env."""
+        for key in self.MONITORING_ENV:
+            monkeypatch.delenv(key, raising=False)
+
+        heimdall_dir = tmp_path / ".heimdall"
+        heimdall_dir.mkdir()
+        config_data = {
+            "monitoring": {
+                "target_path": "./file-docs",
+                "interval_seconds": 15.0,
+                "ignore_patterns": [".git", "build"],
+            }
+        }
+        (heimdall_dir / "config.yaml").write_text(yaml.dump(config_data))
+        return tmp_path
+
+    def test_config_file_read_once(self, project_root: Path) -> None:
+        """Test config.yaml is parsed once per get_monitoring_config call."""
+        with patch(
+            "cognitive_memory.core.config.yaml.safe_load", wraps=yaml.safe_load
+        ) as safe_load:
+            config = get_monitoring_config(project_root)
+
+        safe_load.assert_called_once()
+        assert config["target_path"] == str((project_root / "file-docs").resolve())
+        assert config["interval_seconds"] == 15.0
+        assert config["ignore_patterns"] == [".git", "build"]
+
+    def test_env_overrides_config_file(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test environment variables take priority over config.yaml values."""
+        env_target = project_root / "env-docs"
+        monkeypatch.setenv("MONITORING_TARGET_PATH", str(env_target))
+        monkeypatch.setenv("MONITORING_INTERVAL_SECONDS", "2.5")
+        monkeypatch.setenv("MONITORING_IGNORE_PATTERNS", "dist, .venv")
+
+        config = get_monitoring_config(project_root)
+
+        assert config["target_path"] == str(env_target.resolve())
+        assert config["interval_seconds"] == 2.5
+        assert config["ignore_patterns"] == ["dist", ".venv"]
+        assert get_monitoring_target_path(project_root) == str(env_target.resolve())
+
+    def test_target_path_env_skips_config_file(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test config.yaml is not read when MONITORING_TARGET_PATH is set."""
+        env_target = project_root / "env-docs"
+        monkeypatch.setenv("MONITORING_TARGET_PATH", str(env_target))
+
+        with patch(
+            "cognitive_memory.core.config.yaml.safe_load", wraps=yaml.safe_load
+        ) as safe_load:
+            target_path = get_monitoring_target_path(project_root)
+
+        safe_load.assert_not_called()
+        assert target_path == str(env_target.resolve())
+
+
 class TestSystemConfigWithProject:
     """Test SystemConfig with project integration."""
 
@@ -0,0 +1,95 @@
+"""
+Unit tests for cognitive memory system entry points.
+
+Tests the cognitive_session context manager that owns system
+initialization and shutdown for CLI commands.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import typer
+
+from cognitive_memory.factory import InitializationError
+from cognitive_memory.main import cognitive_session
+
+
+@pytest.fixture
+def mock_lifecycle():
+    """Patch system initialization and shutdown in cognitive_memory.main."""
+    system = Mock()
+    with (
+        patch(
+            "cognitive_memory.main.initialize_system", return_value=system
+        ) as init_system,
+        patch(
+            "cognitive_memory.main.initialize_with_config", return_value=system
+        ) as init_config,
+        patch("cognitive_memory.main.graceful_shutdown") as shutdown,
+    ):
+        yield system, init_system, init_config, shutdown
+
+
+class TestCognitiveSession:
+    """Test cognitive_session lifecycle handling."""
+
+    def test_yields_system_and_shuts_down_on_exit(self, mock_lifecycle):
+        """Test the system is yielded and shut down after a normal exit."""
+        system, _, _, shutdown = mock_lifecycle
+
+        with cognitive_session() as session_system:
+            assert session_system is system
+            shutdown.assert_not_called()
+
+        shutdown.assert_called_once_with(system)
+
+    def test_shuts_down_on_exception(self, mock_lifecycle):
+        """Test the system is shut down when the block raises."""
+        system, _, _, shutdown = mock_lifecycle
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with cognitive_session():
+                raise RuntimeError("boom")
+
+        shutdown.assert_called_once_with(system)
+
+    def test_shuts_down_on_typer_exit(self, mock_lifecycle):
+        """Test the system is shut down when a command exits early."""
+        system, _, _, shutdown = mock_lifecycle
+
+        with pytest.raises(typer.Exit):
+            with cognitive_session():
+                raise typer.Exit(1)
+
+        shutdown.assert_called_once_with(system)
+
+    def test_no_shutdown_when_initialization_fails(self, mock_lifecycle):
+        """Test nothing is shut down when initialization raises."""
+        _, init_system, _, shutdown = mock_lifecycle
+        init_system.side_effect = InitializationError("init failed")
+
+        with pytest.raises(InitializationError, match="init failed"):
+            with cognitive_session():
+                pytest.fail("block should not run")
+
+        shutdown.assert_not_called()
+
+    def test_config_path_takes_precedence_over_profile(self, mock_lifecycle):
+        """Test a config path initializes from that file, ignoring profile."""
+        _, init_system, init_config, _ = mock_lifecycle
+
+        with cognitive_session("custom.env", profile="test"):
+            pass
+
+        init_config.assert_called_once_with("custom.env")
+        init_system.assert_not_called()
+
+    def test_profile_used_without_config_path(self, mock_lifecycle):
+        """Test the profile is used when no config path is given."""
+        _, init_system, init_config, _ = mock_lifecycle
+
+        with cognitive_session(profile="test"):
+            pass
+
+        init_system.assert_called_once_with("test")
+        init_config.assert_not_called()
@@ -173,6 +173,33 @@ Finally, test the setup.
 
         assert markdown_loader.validate_source(str(md_file)) is False
 
+    @pytest.mark.parametrize("offset", [4096, 64 * 1024 + 10])
+    def test_validate_source_invalid_bytes_late_in_file(
+        self, markdown_loader, tmp_path, offset
+    ):
+        """Test validation rejects invalid UTF-8 beyond the first chunk."""
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes(b"# Test\n" + b"a" * offset + b"\xff\n")
+
+        assert markdown_loader.validate_source(str(md_file)) is False
+
+    def test_validate_source_multibyte_across_chunks(self, markdown_loader, tmp_path):
+        """Test a character split across read chunks is still valid UTF-8."""
+        md_file = tmp_path / "test.md"
+        # "é" is two bytes; place it so it straddles the 64 KiB chunk boundary
+        md_file.write_bytes(b"a" * (64 * 1024 - 1) + "é".encode() + b"\n")
+
+        assert markdown_loader.validate_source(str(md_file)) is True
+
+    def test_validate_source_truncated_multibyte_at_end(
+        self, markdown_loader, tmp_path
+    ):
+        """Test a multibyte character cut off at end of file is rejected."""
+        md_file = tmp_path / "test.md"
+        md_file.write_bytes(b"# Test\n" + "é".encode()[:1])
+
+        assert markdown_loader.validate_source(str(md_file)) is False
+
     def test_load_from_source_basic(
         self, markdown_loader, tmp_path, sample_markdown_content
     ):